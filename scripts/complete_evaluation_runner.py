@@ -133,7 +133,7 @@ def main():
                     matching_response_file = response_files[0]
                 
                 # Load candidate responses
-                candidate_responses = file_utils.load_json(matching_response_file)
+                candidate_responses = file_utils.load_json(matching_response_file, schema="candidate_responses")
                 responses = candidate_responses.get("responses", {})
                 
                 # Create questions-responses pairs
@@ -135,7 +135,7 @@ def main():
         
         # Load first sample response file
         response_file = response_files[0]
-        candidate_responses = file_utils.load_json(response_file)
+        candidate_responses = file_utils.load_json(response_file, schema="candidate_responses")
         
         logger.info(f"Loaded responses for candidate: {candidate_responses.get('candidate_id', 'Unknown')}")
         
@@ -264,7 +264,7 @@ def main():
             candidate_id = Path(response_file).stem
             logger.info(f"Processing candidate: {candidate_id}")
             
-            candidate_responses = file_utils.load_json(response_file)
+            candidate_responses = file_utils.load_json(response_file, schema="candidate_responses")
             responses = candidate_responses.get("responses", {})
             
             # Create questions-responses pairs for this candidate
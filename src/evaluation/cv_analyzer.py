@@ -6,15 +6,140 @@ skill extraction, gap analysis, and scoring against job descriptions.
 """
 
 import json
-from typing import Dict, List, Optional, Tuple
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from pathlib import Path
 from loguru import logger
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - the compiled regex is used instead
+    ahocorasick = None
+
 from src.models.llm_client import LLMClient
 from src.utils.prompt_templates import PromptTemplates
 from src.utils.file_utils import FileUtils
 
 
+# Keyword ontology for fallback skill extraction (category -> skills, in output order)
+_CV_SKILLS = {
+    "programming_languages": ("python", "java", "javascript", "c++", "c#", "php", "ruby", "go", "rust"),
+    "frameworks": ("django", "flask", "react", "angular", "vue", "spring", "node.js", "express"),
+    "databases": ("mysql", "postgresql", "mongodb", "redis", "sqlite", "oracle"),
+    "tools": ("git", "docker", "kubernetes", "jenkins", "jira", "confluence", "aws", "azure", "gcp")
+}
+
+# Job requirement rules: (category, reported requirement, keywords that imply it)
+_REQUIREMENT_RULES = (
+    ("programming_languages", "python", ("python",)),
+    ("programming_languages", "java", ("java",)),
+    ("programming_languages", "javascript", ("javascript",)),
+    ("frameworks", "django/flask", ("django", "flask")),
+    ("frameworks", "spring", ("spring",)),
+    ("cloud_platforms", "cloud platforms", ("aws", "azure", "gcp")),
+    ("tools", "docker", ("docker",)),
+    ("tools", "kubernetes", ("kubernetes",)),
+    ("tools", "ci/cd", ("ci/cd", "jenkins")),
+    ("architecture", "microservices", ("microservices",)),
+    ("architecture", "system design", ("system design",))
+)
+
+# Alternative spellings mapped to their canonical skill name
+_SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "golang": "go",
+    "postgres": "postgresql",
+    "nodejs": "node.js",
+    "reactjs": "react",
+    "vuejs": "vue"
+}
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one case-insensitive, whole-token alternation."""
+    # Longest first so e.g. "javascript" is preferred over "java"; the lookarounds act
+    # as word boundaries that also work for keywords such as "c++" and "c#"
+    alternation = "|".join(re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(rf"(?<![\w+#])(?:{alternation})(?![\w+#])", re.IGNORECASE)
+
+
+def _keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over the lower-cased keywords (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in set(keywords):
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_token_char(char: str) -> bool:
+    """Check whether a character continues a token (mirrors the regex lookarounds)."""
+    return char.isalnum() or char in "_+#"
+
+
+def _find_keywords(pattern: re.Pattern, text: str, automaton=None) -> Counter:
+    """
+    Count the canonical (lower-case, alias-resolved) keywords matched in text.
+    
+    Uses the Aho-Corasick automaton when available (one linear pass regardless of
+    the number of keywords) and the compiled regex otherwise.
+    """
+    found = Counter()
+    if automaton is not None:
+        text = text.lower()
+        for end, keyword in automaton.iter(text):
+            start = end - len(keyword) + 1
+            if start > 0 and _is_token_char(text[start - 1]):
+                continue
+            if end + 1 < len(text) and _is_token_char(text[end + 1]):
+                continue
+            found[_SKILL_ALIASES.get(keyword, keyword)] += 1
+        return found
+    
+    for match in pattern.finditer(text):
+        keyword = match.group(0).lower()
+        found[_SKILL_ALIASES.get(keyword, keyword)] += 1
+    return found
+
+
+_SKILL_KEYWORDS = [skill for skills in _CV_SKILLS.values() for skill in skills] + list(_SKILL_ALIASES)
+_REQUIREMENT_KEYWORDS = [keyword for _, _, keywords in _REQUIREMENT_RULES for keyword in keywords] + list(_SKILL_ALIASES)
+
+_SKILL_RE = _keyword_pattern(_SKILL_KEYWORDS)
+_REQUIREMENT_RE = _keyword_pattern(_REQUIREMENT_KEYWORDS)
+_SKILL_AUTOMATON = _keyword_automaton(_SKILL_KEYWORDS)
+_REQUIREMENT_AUTOMATON = _keyword_automaton(_REQUIREMENT_KEYWORDS)
+
+def _flatten_skills(skills) -> FrozenSet[str]:
+    """Flatten skills grouped by category (or given as a plain list) into a lower-cased set."""
+    buckets = skills.values() if isinstance(skills, dict) else [skills]
+    return frozenset(
+        skill.lower() for bucket in buckets if isinstance(bucket, list)
+        for skill in bucket if isinstance(skill, str)
+    )
+
+
+# Score thresholds (lower bounds, ascending) and the labels of the resulting bands
+_RISK_THRESHOLDS = (60, 80)
+_RISK_LABELS = ("high", "medium", "low")
+_HIRING_THRESHOLDS = (50, 70, 85)
+_HIRING_LABELS = ("reject", "consider", "hire", "strong_hire")
+
+
+# Experience level cues (plain substring matches, as before)
+_CV_JUNIOR_RE = re.compile("junior|entry|graduate|intern")
+_CV_SENIOR_RE = re.compile("senior|lead|architect|principal")
+_CV_MID_RE = re.compile("mid|intermediate|3|4|5")
+_JOB_SENIOR_RE = re.compile(r"senior|lead|architect|principal|5\+|6\+|7\+|8\+|9\+|10\+")
+_JOB_JUNIOR_RE = re.compile("junior|entry|graduate|intern|1-3|0-2")
+_JOB_MID_RE = re.compile("mid|intermediate|3-5|4-6")
+
+
 class CVAnalyzer:
     """
     Comprehensive CV analysis system for candidate evaluation.
@@ -34,15 +159,34 @@ class CVAnalyzer:
         self.file_utils = FileUtils()
         self.prompt_templates = PromptTemplates()
         
+        # Truncate prompt inputs with the model's own tokenizer (None on the vLLM backend)
+        if self.llm_client.tokenizer is not None:
+            PromptTemplates.set_tokenizer(self.llm_client.tokenizer)
+        
+        # Optional near-duplicate cache of complete analyses
+        self.semantic_cache = None
+        semantic_config = self.llm_client.config.get('cv_analysis', {}).get('semantic_cache', {})
+        if semantic_config.get('enabled', False):
+            from src.utils.semantic_cache import SemanticCache
+            self.semantic_cache = SemanticCache(
+                directory=semantic_config.get('directory', "data/semantic_cache"),
+                model_name=semantic_config.get('model', "sentence-transformers/all-MiniLM-L6-v2"),
+                threshold=semantic_config.get('threshold', 0.92),
+                min_skill_overlap=semantic_config.get('min_skill_overlap', 0.8)
+            )
+        
         logger.info("CV Analyzer initialized successfully")
     
-    def analyze_cv_against_job(self, cv_file_path: str, job_description_path: str) -> Dict:
+    def analyze_cv_against_job(self, cv_file_path: str, job_description_path: str,
+                               job_description: Optional[str] = None) -> Dict:
         """
         Analyze a CV against a specific job description.
         
         Args:
             cv_file_path: Path to the CV file
             job_description_path: Path to the job description file
+            job_description: Already loaded job description text (read from
+                job_description_path when omitted)
             
         Returns:
             Comprehensive analysis results
@@ -50,7 +194,8 @@ class CVAnalyzer:
         try:
             # Read CV and job description
             cv_text = self.file_utils.read_file(cv_file_path)
-            job_description = self.file_utils.read_file(job_description_path)
+            if job_description is None:
+                job_description = self.file_utils.read_file(job_description_path)
             
             if not cv_text or not job_description:
                 logger.error("Failed to read CV or job description files")
@@ -58,8 +203,18 @@ class CVAnalyzer:
             
             logger.info(f"Analyzing CV: {Path(cv_file_path).name}")
             
-            # Perform comprehensive analysis
-            analysis_result = self._perform_comprehensive_analysis(cv_text, job_description)
+            # Reuse the analysis of a near-duplicate CV against the same job description if one is cached
+            analysis_result = None
+            if self.semantic_cache is not None:
+                embedding = self.semantic_cache.embed(cv_text)
+                skills = self._skill_tokens(cv_text)
+                analysis_result = self.semantic_cache.lookup(job_description, embedding, skills)
+            
+            if analysis_result is None:
+                # Perform comprehensive analysis
+                analysis_result = self._perform_comprehensive_analysis(cv_text, job_description)
+                if self.semantic_cache is not None:
+                    self.semantic_cache.add(job_description, embedding, skills, analysis_result)
             
             # Add metadata
             analysis_result["metadata"] = {
@@ -74,6 +229,20 @@ class CVAnalyzer:
             logger.error(f"Error analyzing CV: {e}")
             return {"error": str(e)}
     
+    def _skill_tokens(self, cv_text: str) -> Set[str]:
+        """
+        Collect the lower-cased technical skills found in a CV.
+        
+        Used as the lexical guard of the semantic cache.
+        
+        Args:
+            cv_text: CV content
+            
+        Returns:
+            Set of skill tokens
+        """
+        return set(_flatten_skills(self._extract_cv_skills(cv_text).get("technical_skills", {})))
+    
     def _perform_comprehensive_analysis(self, cv_text: str, job_description: str) -> Dict:
         """
         Perform comprehensive CV analysis using multiple approaches.
@@ -184,22 +353,14 @@ class CVAnalyzer:
         }
         
         try:
-            # Extract all skills from CV
-            cv_all_skills = set()
-            if "technical_skills" in cv_skills:
-                for category, skills in cv_skills["technical_skills"].items():
-                    if isinstance(skills, list):
-                        cv_all_skills.update([skill.lower() for skill in skills])
-            
-            # Extract required skills from job
-            job_all_skills = set()
-            if "required_skills" in job_requirements and "technical_skills" in job_requirements["required_skills"]:
-                for category, skills in job_requirements["required_skills"]["technical_skills"].items():
-                    if isinstance(skills, list):
-                        job_all_skills.update([skill.lower() for skill in skills])
-            
-            # Calculate missing skills
-            gaps["missing_technical_skills"] = list(job_all_skills - cv_all_skills)
+            # Flatten CV and required skills into lower-cased sets
+            required = job_requirements.get("required_skills", {})
+            cv_all_skills = _flatten_skills(cv_skills.get("technical_skills", {}))
+            job_all_skills = _flatten_skills(required.get("technical_skills", {}))
+            frequencies = {skill.lower(): count for skill, count in required.get("frequencies", {}).items()}
+            
+            # Calculate missing skills (sorted for deterministic output)
+            gaps["missing_technical_skills"] = sorted(job_all_skills - cv_all_skills)
             
             # Calculate experience gap
             cv_exp = cv_skills.get("experience_level", "unknown")
@@ -211,9 +372,10 @@ class CVAnalyzer:
                 elif cv_exp == "senior" and job_exp == "junior":
                     gaps["experience_gap"] = "senior_applying_for_junior"
             
-            # Calculate gap score with experience consideration
-            total_required = len(job_all_skills)
-            missing_count = len(gaps["missing_technical_skills"])
+            # Calculate gap score with experience consideration; requirements the job
+            # description mentions more often weigh more (weight 1 when no frequency is known)
+            total_required = sum(frequencies.get(skill, 1) for skill in job_all_skills)
+            missing_count = sum(frequencies.get(skill, 1) for skill in gaps["missing_technical_skills"])
             
             if total_required > 0:
                 base_gap_score = (missing_count / total_required) * 100
@@ -403,12 +565,7 @@ class CVAnalyzer:
             return "high"  # Overqualified candidates have high retention risk
         
         # Then check based on score
-        if overall_score >= 80:
-            return "low"
-        elif overall_score >= 60:
-            return "medium"
-        else:
-            return "high"
+        return _RISK_LABELS[bisect_right(_RISK_THRESHOLDS, overall_score)]
     
     def _determine_hiring_recommendation(self, overall_score: float, skill_gaps: Dict) -> str:
         """Determine hiring recommendation based on score and gaps."""
@@ -416,15 +573,11 @@ class CVAnalyzer:
         if skill_gaps and skill_gaps.get("overqualification_risk") == "high":
             return "consider_with_caution"  # Overqualified - high retention risk
         
-        # Normal scoring logic
-        if overall_score >= 85 and skill_gaps.get("gap_score", 0) < 20:
-            return "strong_hire"
-        elif overall_score >= 70:
+        # Normal scoring logic; a strong hire also needs a small skill gap
+        recommendation = _HIRING_LABELS[bisect_right(_HIRING_THRESHOLDS, overall_score)]
+        if recommendation == "strong_hire" and (skill_gaps or {}).get("gap_score", 0) >= 20:
             return "hire"
-        elif overall_score >= 50:
-            return "consider"
-        else:
-            return "reject"
+        return recommendation
     
     def _extract_strengths_from_cv(self, cv_skills: Dict) -> List[str]:
         """Extract strengths from CV skills."""
@@ -476,40 +629,28 @@ class CVAnalyzer:
         Returns:
             Basic skills dictionary
         """
-        # Simple keyword-based skill extraction
-        common_skills = {
-            "programming_languages": ["python", "java", "javascript", "c++", "c#", "php", "ruby", "go", "rust"],
-            "frameworks": ["django", "flask", "react", "angular", "vue", "spring", "node.js", "express"],
-            "databases": ["mysql", "postgresql", "mongodb", "redis", "sqlite", "oracle"],
-            "tools": ["git", "docker", "kubernetes", "jenkins", "jira", "confluence", "aws", "azure", "gcp"]
-        }
+        # Single pass over the text (Aho-Corasick automaton or precompiled regex)
+        found = _find_keywords(_SKILL_RE, cv_text, _SKILL_AUTOMATON)
         
         cv_lower = cv_text.lower()
         extracted_skills = {
             "technical_skills": {
-                "programming_languages": [],
-                "frameworks": [],
-                "databases": [],
-                "tools": []
+                category: [skill.title() for skill in skills if skill in found]
+                for category, skills in _CV_SKILLS.items()
             },
             "soft_skills": [],
             "experience_level": "unknown",
             "years_experience": "unknown"
         }
         
-        for category, skills in common_skills.items():
-            for skill in skills:
-                if skill in cv_lower:
-                    extracted_skills["technical_skills"][category].append(skill.title())
-        
         # Determine experience level based on keywords
-        if any(word in cv_lower for word in ["junior", "entry", "graduate", "intern"]):
+        if _CV_JUNIOR_RE.search(cv_lower):
             extracted_skills["experience_level"] = "junior"
             extracted_skills["years_experience"] = "1-2"
-        elif any(word in cv_lower for word in ["senior", "lead", "architect", "principal"]):
+        elif _CV_SENIOR_RE.search(cv_lower):
             extracted_skills["experience_level"] = "senior"
             extracted_skills["years_experience"] = "5+"
-        elif any(word in cv_lower for word in ["mid", "intermediate", "3", "4", "5"]):
+        elif _CV_MID_RE.search(cv_lower):
             extracted_skills["experience_level"] = "mid-level"
             extracted_skills["years_experience"] = "3-5"
         
@@ -528,6 +669,7 @@ class CVAnalyzer:
         job_lower = job_description.lower()
         
         # Extract required skills based on keywords
+        found = _find_keywords(_REQUIREMENT_RE, job_description, _REQUIREMENT_AUTOMATON)
         required_skills = {
             "programming_languages": [],
             "frameworks": [],
@@ -537,56 +679,33 @@ class CVAnalyzer:
             "architecture": []
         }
         
-        # Check for programming languages
-        if "python" in job_lower:
-            required_skills["programming_languages"].append("python")
-        if "java" in job_lower:
-            required_skills["programming_languages"].append("java")
-        if "javascript" in job_lower:
-            required_skills["programming_languages"].append("javascript")
-        
-        # Check for frameworks
-        if "django" in job_lower or "flask" in job_lower:
-            required_skills["frameworks"].append("django/flask")
-        if "spring" in job_lower:
-            required_skills["frameworks"].append("spring")
-        
-        # Check for cloud platforms
-        if "aws" in job_lower or "azure" in job_lower or "gcp" in job_lower:
-            required_skills["cloud_platforms"].append("cloud platforms")
-        
-        # Check for DevOps tools
-        if "docker" in job_lower:
-            required_skills["tools"].append("docker")
-        if "kubernetes" in job_lower:
-            required_skills["tools"].append("kubernetes")
-        if "ci/cd" in job_lower or "jenkins" in job_lower:
-            required_skills["tools"].append("ci/cd")
-        
-        # Check for architecture skills
-        if "microservices" in job_lower:
-            required_skills["architecture"].append("microservices")
-        if "system design" in job_lower:
-            required_skills["architecture"].append("system design")
+        # How often each requirement is mentioned, used to weight skill gaps
+        frequencies = {}
+        for category, requirement, keywords in _REQUIREMENT_RULES:
+            count = sum(found[keyword] for keyword in keywords)
+            if count:
+                required_skills[category].append(requirement)
+                frequencies[requirement] = count
         
         # Determine experience level
         experience_level = "unknown"
         years_experience = "unknown"
         
-        if any(word in job_lower for word in ["senior", "lead", "architect", "principal", "5+", "6+", "7+", "8+", "9+", "10+"]):
+        if _JOB_SENIOR_RE.search(job_lower):
             experience_level = "senior"
             years_experience = "5+"
-        elif any(word in job_lower for word in ["junior", "entry", "graduate", "intern", "1-3", "0-2"]):
+        elif _JOB_JUNIOR_RE.search(job_lower):
             experience_level = "junior"
             years_experience = "1-3"
-        elif any(word in job_lower for word in ["mid", "intermediate", "3-5", "4-6"]):
+        elif _JOB_MID_RE.search(job_lower):
             experience_level = "mid-level"
             years_experience = "3-5"
         
         return {
             "required_skills": {
                 "technical_skills": required_skills,
-                "soft_skills": []
+                "soft_skills": [],
+                "frequencies": frequencies
             },
             "experience_requirements": {
                 "years_experience": years_experience,
@@ -606,6 +725,8 @@ class CVAnalyzer:
         """
         Analyze multiple CVs against a single job description.
         
+        The job description is read once and shared by all analyses.
+        
         Args:
             cv_files: List of CV file paths
             job_description_path: Path to job description file
@@ -614,13 +735,17 @@ class CVAnalyzer:
             Dictionary with analysis results for each CV
         """
         results = {}
+        if not cv_files:
+            return results
+        
+        job_description = self.file_utils.read_file(job_description_path)
         
         for cv_file in cv_files:
             try:
                 cv_name = Path(cv_file).stem
                 logger.info(f"Analyzing CV: {cv_name}")
                 
-                analysis = self.analyze_cv_against_job(cv_file, job_description_path)
+                analysis = self.analyze_cv_against_job(cv_file, job_description_path, job_description)
                 results[cv_name] = analysis
                 
             except Exception as e:
@@ -645,7 +770,7 @@ class CVAnalyzer:
     
     def generate_analysis_summary(self, results: Dict) -> str:
         """
-        Generate a summary of CV analysis results.
+        Generate a summary of CV analysis results, ranked by overall score.
         
         Args:
             results: Analysis results dictionary
@@ -653,25 +778,33 @@ class CVAnalyzer:
         Returns:
             Markdown formatted summary
         """
-        summary = "# CV Analysis Summary\n\n"
+        parts = ["# CV Analysis Summary\n\n"]
+        
+        # Rank candidates by overall score (highest first); failed analyses go last
+        def rank_key(item):
+            analysis = item[1]
+            if "error" in analysis:
+                return float("inf")
+            score = analysis.get("overall_assessment", {}).get("overall_score", 0)
+            return -score if isinstance(score, (int, float)) else 0
         
-        for cv_name, analysis in results.items():
+        for cv_name, analysis in sorted(results.items(), key=rank_key):
             if "error" in analysis:
-                summary += f"## {cv_name}\n**Error**: {analysis['error']}\n\n"
+                parts.append(f"## {cv_name}\n**Error**: {analysis['error']}\n\n")
                 continue
             
             overall = analysis.get("overall_assessment", {})
-            summary += f"## {cv_name}\n"
-            summary += f"- **Overall Score**: {overall.get('overall_score', 'N/A'):.1f}/100\n"
-            summary += f"- **Hiring Recommendation**: {overall.get('hiring_recommendation', 'N/A')}\n"
-            summary += f"- **Risk Level**: {overall.get('risk_level', 'N/A')}\n"
+            parts.append(f"## {cv_name}\n")
+            parts.append(f"- **Overall Score**: {overall.get('overall_score', 'N/A'):.1f}/100\n")
+            parts.append(f"- **Hiring Recommendation**: {overall.get('hiring_recommendation', 'N/A')}\n")
+            parts.append(f"- **Risk Level**: {overall.get('risk_level', 'N/A')}\n")
             
             if overall.get("strengths"):
-                summary += f"- **Strengths**: {', '.join(overall['strengths'][:3])}\n"
+                parts.append(f"- **Strengths**: {', '.join(overall['strengths'][:3])}\n")
             
             if overall.get("weaknesses"):
-                summary += f"- **Weaknesses**: {', '.join(overall['weaknesses'][:3])}\n"
+                parts.append(f"- **Weaknesses**: {', '.join(overall['weaknesses'][:3])}\n")
             
-            summary += "\n"
+            parts.append("\n")
         
-        return summary
+        return "".join(parts)
@@ -102,8 +102,40 @@ class InterviewScorer:
         Returns:
             Comprehensive scoring results for all responses
         """
+        try:
+            individual_scores = []
+            for i, qr in enumerate(questions_responses):
+                question = qr.get("question", "")
+                response = qr.get("response", "")
+                
+                if not question or not response:
+                    logger.warning(f"Skipping empty question/response at index {i}")
+                    continue
+                
+                # Score individual response
+                score_result = self.score_interview_response(question, response)
+                score_result["question_index"] = i
+                individual_scores.append(score_result)
+            
+            return self.summarize_scores(individual_scores, len(questions_responses))
+            
+        except Exception as e:
+            logger.error(f"Error scoring multiple responses: {e}")
+            return {"error": str(e)}
+    
+    def summarize_scores(self, individual_scores: List[Dict], num_questions: Optional[int] = None) -> Dict:
+        """
+        Aggregate already scored responses into an overall interview assessment.
+        
+        Args:
+            individual_scores: Results of ``score_interview_response``
+            num_questions: Number of questions asked (defaults to the number of scores)
+            
+        Returns:
+            Scoring results with the same keys as ``score_multiple_responses``
+        """
         results = {
-            "individual_scores": [],
+            "individual_scores": individual_scores,
             "overall_assessment": {},
             "summary_statistics": {},
             "recommendations": []
@@ -118,19 +150,7 @@ class InterviewScorer:
                 "cultural_fit": []
             }
             
-            for i, qr in enumerate(questions_responses):
-                question = qr.get("question", "")
-                response = qr.get("response", "")
-                
-                if not question or not response:
-                    logger.warning(f"Skipping empty question/response at index {i}")
-                    continue
-                
-                # Score individual response
-                score_result = self.score_interview_response(question, response)
-                score_result["question_index"] = i
-                results["individual_scores"].append(score_result)
-                
+            for score_result in individual_scores:
                 # Accumulate scores
                 if "overall_score" in score_result:
                     total_score += score_result["overall_score"]
@@ -141,9 +161,12 @@ class InterviewScorer:
                         if criteria in criteria_scores:
                             criteria_scores[criteria].append(score)
             
+            if num_questions is None:
+                num_questions = len(individual_scores)
+            
             # Calculate overall assessment
             results["overall_assessment"] = self._calculate_overall_assessment(
-                results["individual_scores"], total_score, len(questions_responses)
+                individual_scores, total_score, num_questions
             )
             
             # Calculate summary statistics
@@ -159,7 +182,7 @@ class InterviewScorer:
             return results
             
         except Exception as e:
-            logger.error(f"Error scoring multiple responses: {e}")
+            logger.error(f"Error summarizing interview scores: {e}")
             return {"error": str(e)}
     
     def _calculate_overall_assessment(self, individual_scores: List[Dict], 
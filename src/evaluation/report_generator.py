@@ -5,15 +5,205 @@ This module provides comprehensive report generation functionality, combining
 CV analysis and interview scoring results into professional evaluation reports.
 """
 
+import copy
 import json
-from typing import Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
 
-from src.models.llm_client import LLMClient
+from src.models.llm_client import LLMClient, load_config
 from src.utils.prompt_templates import PromptTemplates
-from src.utils.file_utils import FileUtils
+from src.utils.file_utils import FileUtils, _dump_json_bytes
+
+
+# Recommendation-specific report sections. Each recommendation label maps to
+# constant content, so the sections are looked up instead of rebuilt per call.
+_NEXT_STEPS_BY_RECOMMENDATION = {
+    "strong_hire": {
+        "immediate_actions": [
+            "Extend offer immediately",
+            "Schedule onboarding meeting",
+            "Prepare employment contract"
+        ],
+        "timeline": {
+            "offer_deadline": "Within 1 week",
+            "start_date": "Within 2-4 weeks",
+            "onboarding": "First 2 weeks"
+        },
+        "additional_assessments": []
+    },
+    "hire": {
+        "immediate_actions": [
+            "Extend offer",
+            "Schedule follow-up meeting",
+            "Prepare onboarding plan"
+        ],
+        "timeline": {
+            "offer_deadline": "Within 1 week",
+            "start_date": "Within 2-4 weeks",
+            "onboarding": "First 2 weeks"
+        },
+        "additional_assessments": []
+    },
+    "consider": {
+        "immediate_actions": [
+            "Schedule additional interview",
+            "Request references",
+            "Consider probationary period"
+        ],
+        "timeline": {
+            "additional_assessment": "Within 1 week",
+            "decision_deadline": "Within 2 weeks",
+            "start_date": "Within 4-6 weeks"
+        },
+        "additional_assessments": [
+            "Technical coding test",
+            "Reference checks",
+            "Cultural fit interview",
+            "Skills assessment"
+        ]
+    },
+    "reject": {
+        "immediate_actions": [
+            "Send rejection letter",
+            "Provide constructive feedback",
+            "Keep candidate in database for future opportunities"
+        ],
+        "timeline": {
+            "rejection_notice": "Within 1 week",
+            "feedback_provided": "Within 2 weeks"
+        },
+        "additional_assessments": []
+    }
+}
+
+_ONBOARDING_BY_RECOMMENDATION = {
+    "strong_hire": (
+        "Standard onboarding process",
+        "Technical skills assessment",
+        "Team introduction and shadowing",
+        "Mentor assignment"
+    ),
+    "hire": (
+        "Standard onboarding process",
+        "Technical skills assessment",
+        "Team introduction and shadowing",
+        "Mentor assignment"
+    ),
+    "consider": (
+        "Extended probationary period",
+        "Focused training program",
+        "Regular performance reviews",
+        "Skills development plan"
+    )
+}
+
+_SUMMARY_NEXT_STEPS_BY_RECOMMENDATION = {
+    "strong_hire": "- Extend offer\n- Schedule onboarding\n- Prepare employment contract\n",
+    "hire": "- Extend offer\n- Schedule onboarding\n- Prepare employment contract\n",
+    "consider": "- Schedule additional assessment\n- Request references\n- Consider probationary period\n",
+    "reject": "- Send rejection notice\n- Provide constructive feedback\n- Keep in database for future opportunities\n"
+}
+
+
+# Score thresholds and the labels of the ranges they delimit
+_PERF_THRESHOLDS = (50, 70, 85)
+_PERF_LEVELS = ("Poor", "Fair", "Good", "Excellent")
+
+_GAP_THRESHOLDS = (25, 50)
+_GAP_IMPACTS = ("Low", "Medium", "High")
+
+_DECISION_DEADLINES = {
+    "strong_hire": "Within 1 week",
+    "hire": "Within 1 week",
+    "consider": "Within 2 weeks"
+}
+
+
+def _get_performance_level(score: float) -> str:
+    """Get performance level based on score."""
+    return _PERF_LEVELS[bisect_right(_PERF_THRESHOLDS, score)]
+
+
+def _assess_gap_impact(skill_gaps: Dict) -> str:
+    """Assess the impact of skill gaps."""
+    return _GAP_IMPACTS[bisect_left(_GAP_THRESHOLDS, skill_gaps.get("gap_score", 0))]
+
+
+def _calculate_decision_deadline(recommendation: str) -> str:
+    """Calculate decision deadline based on recommendation."""
+    return _DECISION_DEADLINES.get(recommendation, "Within 1 week")
+
+
+# Last report timestamp, refreshed at most once per second
+_ts_cache = [0.0, ""]
+
+
+def _get_timestamp() -> str:
+    """Get current timestamp for metadata (second resolution is enough for reports)."""
+    now = time.time()
+    if now - _ts_cache[0] >= 1.0:
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[0] = now
+    return _ts_cache[1]
+
+
+# Process-wide LLM clients by config path, shared by all generators
+_LLM_CLIENTS: Dict[str, LLMClient] = {}
+_LLM_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_llm_client(config_path: str) -> LLMClient:
+    """Return the process-wide LLM client for a config, loading the model on first use."""
+    with _LLM_CLIENTS_LOCK:
+        client = _LLM_CLIENTS.get(config_path)
+        if client is None:
+            client = _LLM_CLIENTS[config_path] = LLMClient(config_path)
+        return client
+
+
+@lru_cache(maxsize=1)
+def _get_file_utils() -> FileUtils:
+    """Return a shared FileUtils instance rooted at the working directory."""
+    return FileUtils()
+
+
+@lru_cache(maxsize=1)
+def _get_prompt_templates() -> PromptTemplates:
+    """Return a shared PromptTemplates instance (all templates are stateless)."""
+    return PromptTemplates()
+
+
+def _generate_reports_worker(config_path: str, evaluations: List[Dict]) -> Dict:
+    """Generate batch reports for a shard of evaluations inside a worker process."""
+    return ReportGenerator(config_path).generate_batch_reports(evaluations)
+
+
+def _generate_shard_worker(config_path: str, evaluations: List[Dict],
+                           cpu_ids: Optional[List[int]], gpu_id: Optional[int]) -> Dict:
+    """Pin a worker process to its CPU cores or GPU, then generate the reports of its shard."""
+    if gpu_id is not None:
+        # Must be set before the worker's first CUDA call
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_id)
+    
+    if cpu_ids:
+        import torch
+        
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpu_ids)
+        torch.set_num_threads(len(cpu_ids))
+    
+    return _generate_reports_worker(config_path, evaluations)
 
 
 class ReportGenerator:
@@ -28,15 +218,26 @@ class ReportGenerator:
         """
         Initialize the report generator with LLM client and utilities.
         
+        The LLM client and utilities are shared between generator instances, so
+        creating one generator per candidate does not reload the model. The
+        model is loaded on first use, so the multi-process batch methods can
+        run without a replica in this process.
+        
         Args:
             config_path: Path to configuration file
         """
-        self.llm_client = LLMClient(config_path)
-        self.file_utils = FileUtils()
-        self.prompt_templates = PromptTemplates()
+        self.config_path = config_path
+        self.config = load_config(config_path)
+        self.file_utils = _get_file_utils()
+        self.prompt_templates = _get_prompt_templates()
         
         logger.info("Report Generator initialized successfully")
     
+    @property
+    def llm_client(self) -> LLMClient:
+        """LLM client shared by all generators using the same config (loaded on first access)."""
+        return _get_llm_client(self.config_path)
+    
     def generate_comprehensive_report(self, cv_analysis: Dict, interview_scores: Dict, 
                                     candidate_info: Dict = None) -> Dict:
         """
@@ -60,33 +261,47 @@ class ReportGenerator:
             # Generate LLM-based report
             llm_report = self._generate_llm_report(cv_analysis, interview_scores, candidate_info)
             
-            # Generate structured report
-            structured_report = self._generate_structured_report(cv_analysis, interview_scores, candidate_info)
-            
-            # Generate summary report
-            summary_report = self._generate_summary_report(cv_analysis, interview_scores, candidate_info)
-            
-            # Combine all reports
-            comprehensive_report = {
-                "candidate_info": candidate_info,
-                "cv_analysis": cv_analysis,
-                "interview_scores": interview_scores,
-                "llm_report": llm_report,
-                "structured_report": structured_report,
-                "summary_report": summary_report,
-                "final_recommendation": self._generate_final_recommendation(cv_analysis, interview_scores),
-                "metadata": {
-                    "generation_timestamp": self._get_timestamp(),
-                    "report_version": "1.0"
-                }
-            }
-            
-            return comprehensive_report
+            return self._assemble_report(cv_analysis, interview_scores, candidate_info, llm_report)
             
         except Exception as e:
             logger.error(f"Error generating comprehensive report: {e}")
             return {"error": str(e)}
     
+    def _assemble_report(self, cv_analysis: Dict, interview_scores: Dict,
+                         candidate_info: Dict, llm_report: str) -> Dict:
+        """
+        Combine an already generated LLM report with the rule-based report sections.
+        
+        Args:
+            cv_analysis: CV analysis results
+            interview_scores: Interview scoring results
+            candidate_info: Candidate information
+            llm_report: LLM-generated report text
+            
+        Returns:
+            Comprehensive report dictionary
+        """
+        # Generate structured report
+        structured_report = self._generate_structured_report(cv_analysis, interview_scores, candidate_info)
+        
+        # Generate summary report
+        summary_report = self._generate_summary_report(cv_analysis, interview_scores, candidate_info)
+        
+        # Combine all reports
+        return {
+            "candidate_info": candidate_info,
+            "cv_analysis": cv_analysis,
+            "interview_scores": interview_scores,
+            "llm_report": llm_report,
+            "structured_report": structured_report,
+            "summary_report": summary_report,
+            "final_recommendation": self._generate_final_recommendation(cv_analysis, interview_scores),
+            "metadata": {
+                "generation_timestamp": _get_timestamp(),
+                "report_version": "1.0"
+            }
+        }
+    
     def _extract_candidate_info(self, cv_analysis: Dict) -> Dict:
         """
         Extract basic candidate information from CV analysis.
@@ -248,7 +463,7 @@ class ReportGenerator:
                 "cv_score": round(cv_score, 1),
                 "interview_score": round(interview_score, 1),
                 "overall_score": round(overall_score, 1),
-                "performance_level": self._get_performance_level(overall_score)
+                "performance_level": _get_performance_level(overall_score)
             }
             
             # Key findings
@@ -321,7 +536,7 @@ class ReportGenerator:
                 assessment["technical_gaps"] = {
                     "missing_technical_skills": cv_analysis["skill_gaps"].get("missing_technical_skills", []),
                     "missing_tools": cv_analysis["skill_gaps"].get("missing_tools", []),
-                    "gap_impact": self._assess_gap_impact(cv_analysis["skill_gaps"])
+                    "gap_impact": _assess_gap_impact(cv_analysis["skill_gaps"])
                 }
             
             # Technical score
@@ -499,23 +714,9 @@ class ReportGenerator:
             recommendations["development_areas"] = list(set(development_areas))[:5]  # Remove duplicates, limit to 5
             
             # Onboarding suggestions
-            onboarding_suggestions = []
-            if recommendations["hiring_recommendation"] in ["hire", "strong_hire"]:
-                onboarding_suggestions.extend([
-                    "Standard onboarding process",
-                    "Technical skills assessment",
-                    "Team introduction and shadowing",
-                    "Mentor assignment"
-                ])
-            elif recommendations["hiring_recommendation"] == "consider":
-                onboarding_suggestions.extend([
-                    "Extended probationary period",
-                    "Focused training program",
-                    "Regular performance reviews",
-                    "Skills development plan"
-                ])
-            
-            recommendations["onboarding_suggestions"] = onboarding_suggestions
+            recommendations["onboarding_suggestions"] = list(
+                _ONBOARDING_BY_RECOMMENDATION.get(recommendations["hiring_recommendation"], ())
+            )
             
             # Team fit considerations
             team_fit = []
@@ -556,62 +757,14 @@ class ReportGenerator:
         try:
             recommendation = self._generate_final_recommendation(cv_analysis, interview_scores)
             
-            # Immediate actions
-            if recommendation == "strong_hire":
-                next_steps["immediate_actions"] = [
-                    "Extend offer immediately",
-                    "Schedule onboarding meeting",
-                    "Prepare employment contract"
-                ]
-            elif recommendation == "hire":
-                next_steps["immediate_actions"] = [
-                    "Extend offer",
-                    "Schedule follow-up meeting",
-                    "Prepare onboarding plan"
-                ]
-            elif recommendation == "consider":
-                next_steps["immediate_actions"] = [
-                    "Schedule additional interview",
-                    "Request references",
-                    "Consider probationary period"
-                ]
-            else:  # reject
-                next_steps["immediate_actions"] = [
-                    "Send rejection letter",
-                    "Provide constructive feedback",
-                    "Keep candidate in database for future opportunities"
-                ]
-            
-            # Timeline
-            if recommendation in ["strong_hire", "hire"]:
-                next_steps["timeline"] = {
-                    "offer_deadline": "Within 1 week",
-                    "start_date": "Within 2-4 weeks",
-                    "onboarding": "First 2 weeks"
-                }
-            elif recommendation == "consider":
-                next_steps["timeline"] = {
-                    "additional_assessment": "Within 1 week",
-                    "decision_deadline": "Within 2 weeks",
-                    "start_date": "Within 4-6 weeks"
-                }
-            else:
-                next_steps["timeline"] = {
-                    "rejection_notice": "Within 1 week",
-                    "feedback_provided": "Within 2 weeks"
-                }
-            
-            # Additional assessments
-            if recommendation == "consider":
-                next_steps["additional_assessments"] = [
-                    "Technical coding test",
-                    "Reference checks",
-                    "Cultural fit interview",
-                    "Skills assessment"
-                ]
+            # Immediate actions, timeline and additional assessments
+            sections = _NEXT_STEPS_BY_RECOMMENDATION.get(
+                recommendation, _NEXT_STEPS_BY_RECOMMENDATION["reject"]
+            )
+            next_steps.update(copy.deepcopy(sections))
             
             # Decision deadline
-            next_steps["decision_deadline"] = self._calculate_decision_deadline(recommendation)
+            next_steps["decision_deadline"] = _calculate_decision_deadline(recommendation)
             
         except Exception as e:
             logger.error(f"Error generating next steps: {e}")
@@ -650,7 +803,7 @@ class ReportGenerator:
             summary += f"- **CV Score**: {cv_score:.1f}/100\n"
             summary += f"- **Interview Score**: {interview_score:.1f}/10\n"
             summary += f"- **Overall Score**: {overall_score:.1f}/100\n"
-            summary += f"- **Performance Level**: {self._get_performance_level(overall_score)}\n\n"
+            summary += f"- **Performance Level**: {_get_performance_level(overall_score)}\n\n"
             
             # Key findings
             summary += "## Key Findings\n"
@@ -679,12 +832,9 @@ class ReportGenerator:
             
             # Next steps
             summary += "## Next Steps\n"
-            if final_rec in ["strong_hire", "hire"]:
-                summary += "- Extend offer\n- Schedule onboarding\n- Prepare employment contract\n"
-            elif final_rec == "consider":
-                summary += "- Schedule additional assessment\n- Request references\n- Consider probationary period\n"
-            else:
-                summary += "- Send rejection notice\n- Provide constructive feedback\n- Keep in database for future opportunities\n"
+            summary += _SUMMARY_NEXT_STEPS_BY_RECOMMENDATION.get(
+                final_rec, _SUMMARY_NEXT_STEPS_BY_RECOMMENDATION["reject"]
+            )
             
         except Exception as e:
             logger.error(f"Error generating summary report: {e}")
@@ -724,40 +874,6 @@ class ReportGenerator:
             logger.error(f"Error generating final recommendation: {e}")
             return "consider"
     
-    def _get_performance_level(self, score: float) -> str:
-        """Get performance level based on score."""
-        if score >= 85:
-            return "Excellent"
-        elif score >= 70:
-            return "Good"
-        elif score >= 50:
-            return "Fair"
-        else:
-            return "Poor"
-    
-    def _assess_gap_impact(self, skill_gaps: Dict) -> str:
-        """Assess the impact of skill gaps."""
-        gap_score = skill_gaps.get("gap_score", 0)
-        if gap_score > 50:
-            return "High"
-        elif gap_score > 25:
-            return "Medium"
-        else:
-            return "Low"
-    
-    def _calculate_decision_deadline(self, recommendation: str) -> str:
-        """Calculate decision deadline based on recommendation."""
-        if recommendation in ["strong_hire", "hire"]:
-            return "Within 1 week"
-        elif recommendation == "consider":
-            return "Within 2 weeks"
-        else:
-            return "Within 1 week"
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp for metadata."""
-        return datetime.now().isoformat()
-    
     def save_report(self, report: Dict, output_path: str, format: str = "json"):
         """
         Save report to file in specified format.
@@ -782,29 +898,352 @@ class ReportGenerator:
         except Exception as e:
             logger.error(f"Error saving report: {e}")
     
+    async def save_report_async(self, report: Dict, output_path: str, format: str = "json"):
+        """
+        Save report to file without blocking the event loop.
+        
+        Async counterpart of ``save_report`` for callers running inside an
+        event loop (e.g. a web server handling concurrent evaluations).
+        
+        Args:
+            report: Report data
+            output_path: Output file path
+            format: Output format ("json", "markdown", "html")
+        """
+        try:
+            if format == "json":
+                await self.file_utils.save_json_async(report, output_path)
+            elif format == "markdown":
+                summary = report.get("summary_report", "No summary available")
+                await self.file_utils.save_markdown_async(summary, output_path)
+            else:
+                logger.warning(f"Unsupported format: {format}, saving as JSON")
+                await self.file_utils.save_json_async(report, output_path)
+            
+            logger.info(f"Report saved to: {output_path}")
+            
+        except Exception as e:
+            logger.error(f"Error saving report: {e}")
+    
+    def save_reports_batch(self, reports: Dict[str, Dict], out_dir: str,
+                           format: str = "json", max_workers: int = 8) -> Dict[str, str]:
+        """
+        Save many reports at once with concurrent serialization and writes.
+        
+        Every report is serialized to bytes in a thread pool (as
+        ``FileUtils.save_json`` does) and all files are written concurrently, so the batch waits on
+        storage latency roughly once instead of once per report.
+        
+        Args:
+            reports: Reports keyed by candidate name, as returned by ``generate_batch_reports``
+            out_dir: Output directory
+            format: Output format ("json" or "markdown")
+            max_workers: Maximum number of concurrent writer threads
+            
+        Returns:
+            Dictionary mapping candidate names to the written file paths
+        """
+        if format not in ("json", "markdown"):
+            logger.warning(f"Unsupported format: {format}, saving as JSON")
+            format = "json"
+        
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        extension = "json" if format == "json" else "md"
+        
+        def serialize(report: Dict) -> bytes:
+            if format == "markdown":
+                return report.get("summary_report", "No summary available").encode("utf-8")
+            # Same encoding as FileUtils.save_json, including numpy values
+            return _dump_json_bytes(report)
+        
+        def write(name: str, report: Dict) -> Tuple[str, Optional[str]]:
+            safe_name = str(name).replace("/", "_").replace("\\", "_")
+            output_path = out_dir / f"{safe_name}_report.{extension}"
+            try:
+                output_path.write_bytes(serialize(report))
+                return name, str(output_path)
+            except Exception as e:
+                logger.error(f"Error saving report for candidate {name}: {e}")
+                return name, None
+        
+        saved_paths = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(reports) or 1))) as executor:
+            for name, output_path in executor.map(lambda item: write(*item), reports.items()):
+                if output_path is not None:
+                    saved_paths[name] = output_path
+        
+        logger.info(f"Saved {len(saved_paths)} of {len(reports)} reports to: {out_dir}")
+        return saved_paths
+    
     def generate_batch_reports(self, evaluations: List[Dict]) -> Dict:
         """
         Generate reports for multiple candidates.
         
+        The LLM reports are generated with batched model calls; the rule-based
+        sections are then assembled per candidate.
+        
         Args:
             evaluations: List of evaluation dictionaries
             
         Returns:
             Dictionary with reports for each candidate
         """
-        batch_reports = {}
+        return dict(self.iter_batch_reports(evaluations))
+    
+    def iter_batch_reports(self, evaluations: Iterable[Dict]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Generate reports for multiple candidates, yielding each as soon as it is ready.
+        
+        Evaluations are consumed in chunks of ``hardware.batch_size``; the LLM
+        reports of a chunk are generated with one batched model call, so only
+        one chunk of reports is held in memory at a time.
+        
+        Args:
+            evaluations: Evaluation dictionaries (any iterable)
+            
+        Yields:
+            Tuples of candidate name and report
+        """
+        chunk_size = max(1, self.config.get('hardware', {}).get('batch_size', 8))
+        iterator = iter(evaluations)
+        
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield from self._generate_report_chunk(chunk)
+    
+    def _generate_report_chunk(self, evaluations: List[Dict]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Generate the reports of one chunk of candidates with a single batched LLM call.
+        
+        Args:
+            evaluations: Evaluation dictionaries of the chunk
+            
+        Yields:
+            Tuples of candidate name and report
+        """
+        pending = []
         
+        # Collect the LLM report prompt of every candidate
         for evaluation in evaluations:
+            candidate_name = evaluation.get("candidate_name", "Unknown")
             try:
-                candidate_name = evaluation.get("candidate_name", "Unknown")
                 cv_analysis = evaluation.get("cv_analysis", {})
                 interview_scores = evaluation.get("interview_scores", {})
+                candidate_info = self._extract_candidate_info(cv_analysis)
+                prompt = self.prompt_templates.report_generation_prompt(
+                    cv_analysis, interview_scores, candidate_info
+                )
+                pending.append((candidate_name, cv_analysis, interview_scores, candidate_info, prompt))
                 
-                report = self.generate_comprehensive_report(cv_analysis, interview_scores)
-                batch_reports[candidate_name] = report
+            except Exception as e:
+                logger.error(f"Error preparing report for candidate {candidate_name}: {e}")
+                yield candidate_name, {"error": str(e)}
+        
+        # Run the LLM once for the whole chunk
+        try:
+            llm_reports = self.llm_client.generate_responses([item[4] for item in pending])
+        except Exception as e:
+            logger.error(f"Error generating reports for {len(pending)} candidates: {e}")
+            for item in pending:
+                yield item[0], {"error": str(e)}
+            return
+        
+        # Zip the LLM reports back with the per-candidate sections
+        for (candidate_name, cv_analysis, interview_scores, candidate_info, _), llm_report in zip(pending, llm_reports):
+            try:
+                yield candidate_name, self._assemble_report(
+                    cv_analysis, interview_scores, candidate_info, llm_report
+                )
                 
             except Exception as e:
                 logger.error(f"Error generating report for candidate {candidate_name}: {e}")
-                batch_reports[candidate_name] = {"error": str(e)}
+                yield candidate_name, {"error": str(e)}
+    
+    def stream_batch_reports(self, evaluations: Iterable[Dict],
+                             sink: Callable[[str, Dict], None]) -> int:
+        """
+        Generate reports on a producer thread and hand each one to a sink as it arrives.
+        
+        Reports pass through a bounded queue of ``hardware.prefetch`` entries,
+        so the sink (typically saving the report) overlaps with generation of
+        the following reports without buffering the whole batch.
+        
+        Args:
+            evaluations: Evaluation dictionaries (any iterable)
+            sink: Callable receiving the candidate name and report
+            
+        Returns:
+            Number of reports delivered to the sink
+        """
+        prefetch = self.config.get('hardware', {}).get('prefetch', 4)
+        reports = queue.Queue(maxsize=max(1, prefetch))
+        done = object()
+        failure = []
+        
+        def produce():
+            try:
+                for item in self.iter_batch_reports(evaluations):
+                    reports.put(item)
+            except Exception as e:
+                failure.append(e)
+            finally:
+                reports.put(done)
+        
+        producer = threading.Thread(target=produce, name="report-producer", daemon=True)
+        producer.start()
+        
+        delivered = 0
+        while True:
+            item = reports.get()
+            if item is done:
+                break
+            
+            candidate_name, report = item
+            try:
+                sink(candidate_name, report)
+                delivered += 1
+            except Exception as e:
+                logger.error(f"Error handling report for candidate {candidate_name}: {e}")
+        
+        producer.join()
+        if failure:
+            logger.error(f"Report generation stopped early: {failure[0]}")
+        
+        return delivered
+    
+    def _replica_plan(self, requested: int) -> Tuple[int, int]:
+        """
+        Decide how many worker processes may each load a model replica.
+        
+        On GPU hosts every replica gets a device of its own, so the count is
+        capped at the number of GPUs. If this process already holds a model on
+        the GPU, no workers are started, since their replicas would compete
+        with it for the same memory.
+        
+        Args:
+            requested: Requested number of replicas
+            
+        Returns:
+            Number of worker processes (1 means generating in this process) and
+            the number of GPUs they are spread over (0 on CPU hosts)
+        """
+        import torch
+        
+        if not (self.config.get('hardware', {}).get('use_gpu', False) and torch.cuda.is_available()):
+            return requested, 0
+        
+        loaded = _LLM_CLIENTS.get(self.config_path)
+        if loaded is not None and loaded.device == "cuda":
+            logger.warning("A model is already loaded on the GPU in this process; generating reports without worker processes")
+            return 1, 0
+        
+        gpu_count = torch.cuda.device_count()
+        if requested > gpu_count:
+            logger.info(f"Limiting model replicas to the {gpu_count} available GPU(s)")
+        return min(requested, gpu_count), gpu_count
+    
+    def generate_batch_reports_parallel(self, evaluations: List[Dict],
+                                        num_workers: Optional[int] = None) -> Dict:
+        """
+        Generate reports for multiple candidates across several worker processes.
+        
+        The evaluations are split into one contiguous shard per worker. Each
+        worker loads its own LLM client and runs ``generate_batch_reports`` on
+        its shard, so prompt tokenization and report post-processing in one
+        worker overlap with model generation in another. This process does not
+        load a model; on GPU hosts there is at most one worker per device (see
+        ``_replica_plan``).
+        
+        Args:
+            evaluations: List of evaluation dictionaries
+            num_workers: Number of worker processes (defaults to ``hardware.num_workers``)
+            
+        Returns:
+            Dictionary with reports for each candidate
+        """
+        if num_workers is None:
+            num_workers = self.config.get('hardware', {}).get('num_workers', 2)
+        num_workers, gpu_count = self._replica_plan(max(1, min(num_workers, len(evaluations))))
+        
+        if num_workers == 1:
+            return self.generate_batch_reports(evaluations)
+        
+        # Contiguous shards keep the candidates in their original order
+        shard_size = -(-len(evaluations) // num_workers)
+        shards = [evaluations[i:i + shard_size] for i in range(0, len(evaluations), shard_size)]
+        
+        batch_reports = {}
+        try:
+            # Spawn rather than fork so that each worker initializes CUDA cleanly
+            with ProcessPoolExecutor(max_workers=len(shards),
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [
+                    executor.submit(_generate_shard_worker, self.config_path, shard, None,
+                                    index if gpu_count else None)
+                    for index, shard in enumerate(shards)
+                ]
+                for future in futures:
+                    batch_reports.update(future.result())
+            
+        except Exception as e:
+            logger.error(f"Parallel report generation failed, falling back to a single process: {e}")
+            return self.generate_batch_reports(evaluations)
+        
+        return batch_reports
+    
+    def generate_batch_reports_sharded(self, evaluations: List[Dict],
+                                       n_shards: Optional[int] = None) -> Dict:
+        """
+        Generate reports with one model replica per shard of the hardware.
+        
+        On GPU hosts every shard is pinned to a device of its own through
+        ``CUDA_VISIBLE_DEVICES``, so there are at most as many shards as GPUs.
+        On CPU hosts the available cores are split evenly and each shard is
+        pinned to its own cores, so replicas do not compete for the same caches
+        and memory channels. This process does not load a model.
+        
+        Args:
+            evaluations: List of evaluation dictionaries
+            n_shards: Number of model replicas (defaults to ``hardware.num_shards``)
+            
+        Returns:
+            Dictionary with reports for each candidate
+        """
+        if n_shards is None:
+            n_shards = self.config.get('hardware', {}).get('num_shards', 2)
+        n_shards, gpu_count = self._replica_plan(max(1, min(n_shards, len(evaluations))))
+        
+        # Split the available cores into one contiguous block per shard
+        if hasattr(os, "sched_getaffinity"):
+            cores = sorted(os.sched_getaffinity(0))
+        else:
+            cores = list(range(os.cpu_count() or 1))
+        if not gpu_count:
+            n_shards = min(n_shards, len(cores))
+        
+        if n_shards == 1:
+            return self.generate_batch_reports(evaluations)
+        
+        cores_per_shard = len(cores) // n_shards
+        shard_size = -(-len(evaluations) // n_shards)
+        tasks = []
+        for shard_index, start in enumerate(range(0, len(evaluations), shard_size)):
+            cpu_ids = None if gpu_count else cores[shard_index * cores_per_shard:(shard_index + 1) * cores_per_shard]
+            gpu_id = shard_index if gpu_count else None
+            tasks.append((self.config_path, evaluations[start:start + shard_size], cpu_ids, gpu_id))
+        
+        batch_reports = {}
+        try:
+            # One fresh process per shard, so every replica starts with its own device settings
+            with multiprocessing.get_context("spawn").Pool(len(tasks), maxtasksperchild=1) as pool:
+                for shard_reports in pool.starmap(_generate_shard_worker, tasks):
+                    batch_reports.update(shard_reports)
+            
+        except Exception as e:
+            logger.error(f"Sharded report generation failed, falling back to a single process: {e}")
+            return self.generate_batch_reports(evaluations)
         
         return batch_reports
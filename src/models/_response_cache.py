@@ -0,0 +1,172 @@
+"""
+Response Cache for Candidate Evaluation System
+
+This module provides a content-addressed disk cache for LLM responses. Entries are
+keyed on the model name, the prompt and the sampling parameters, so re-running an
+evaluation on byte-identical inputs returns the stored response instead of calling
+the model again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from loguru import logger
+
+
+_EXPIRY_UNITS = {
+    "S": 1,
+    "M": 60,
+    "H": 60 * 60,
+    "D": 24 * 60 * 60,
+    "W": 7 * 24 * 60 * 60
+}
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Expiry policy for cached responses.
+    
+    Attributes:
+        expiry: Maximum entry age such as "30M", "12H", "1D" or "1W"; None never expires
+    """
+    
+    expiry: Optional[str] = "1W"
+    
+    @property
+    def max_age_seconds(self) -> Optional[float]:
+        """Return the maximum entry age in seconds, or None if entries never expire."""
+        if not self.expiry:
+            return None
+        
+        value, unit = self.expiry[:-1], self.expiry[-1].upper()
+        if unit not in _EXPIRY_UNITS or not value.isdigit():
+            raise ValueError(f"Invalid cache expiry: {self.expiry}")
+        
+        return int(value) * _EXPIRY_UNITS[unit]
+
+
+class ResponseCache:
+    """
+    Disk cache mapping (model, prompt, sampling parameters) to generated responses.
+    
+    Each entry is a small JSON file named after the key. Writes go through a
+    temporary file and an atomic rename, so concurrent readers never see a
+    partially written entry.
+    """
+    
+    def __init__(self, directory: str = "~/.cache/candidate_eval/llm",
+                 policy: Optional[CachePolicy] = None):
+        """
+        Initialize the cache directory.
+        
+        Args:
+            directory: Directory holding the cache entries
+            policy: Expiry policy (defaults to one week)
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.policy = policy or CachePolicy()
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: Union[str, Iterable[str]], temperature: float,
+                 top_p: float, do_sample: bool, max_new_tokens: int,
+                 repetition_penalty: float = 1.0) -> str:
+        """
+        Build the cache key for a generation request.
+        
+        Args:
+            model_name: Name of the model producing the response
+            prompt: Prompt text, or its consecutive parts (hashed as if concatenated)
+            temperature: Sampling temperature
+            top_p: Nucleus sampling threshold
+            do_sample: Whether sampling is enabled
+            max_new_tokens: Maximum number of generated tokens
+            repetition_penalty: Repetition penalty applied during generation
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        
+        parts = [prompt] if isinstance(prompt, str) else prompt
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+        
+        digest.update(b"\0")
+        digest.update(repr((temperature, top_p, do_sample, max_new_tokens, repetition_penalty)).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from ``make_key``
+            
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        path = self._entry_path(key)
+        try:
+            max_age = self.policy.max_age_seconds
+            if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+                return None
+            
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)["response"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+    
+    def set(self, key: str, prompt: str, response: str):
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key from ``make_key``
+            prompt: Prompt that produced the response
+            response: Generated response text
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump({"prompt": prompt, "response": response}, file, ensure_ascii=False)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+    
+    def clear(self) -> int:
+        """
+        Remove all cache entries.
+        
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove cache entry {path}: {e}")
+        
+        logger.info(f"Cleared {removed} cached LLM responses")
+        return removed
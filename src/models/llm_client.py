@@ -5,13 +5,158 @@ This module provides a unified interface for interacting with Hugging Face model
 for CV analysis, interview scoring, and report generation.
 """
 
+import copy
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-from typing import Dict, List, Optional, Union
+from transformers import AutoTokenizer, AutoModelForCausalLM
+from typing import Dict, List, Optional, Set, Tuple
 import yaml
 import os
+import json
+import threading
+from string import Template
+from functools import lru_cache
+from itertools import groupby
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src.models._response_cache import CachePolicy, ResponseCache
+
+# Let the fast tokenizer encode batched prompts on all cores
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+
+# Maximum number of prompt tokens passed to the model
+_MAX_PROMPT_TOKENS = 2048
+
+# Maximum number of static prompt segments whose token ids are kept per client
+_MAX_CACHED_SEGMENTS = 64
+
+
+# libyaml's C loader is much faster than the pure-Python one when it is available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML config file; cached per path and modification time."""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_YAML_LOADER)
+
+
+# Configuration used when the config file is missing
+_DEFAULT_CONFIG = {
+    'model': {
+        'name': 'microsoft/DialoGPT-medium',
+        'max_length': 1024,
+        'temperature': 0.7,
+        'top_p': 0.9,
+        'do_sample': True
+    },
+    'hardware': {
+        'use_gpu': False,
+        'batch_size': 8
+    }
+}
+
+
+def load_config(config_path: str = "config/config.yaml") -> Dict:
+    """
+    Load the configuration without loading a model.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Private copy of the parsed configuration (defaults if the file is missing)
+    """
+    try:
+        # The parsed file is cached until it is modified; hand out a private copy
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        return copy.deepcopy(_read_config(config_path, mtime_ns))
+    except FileNotFoundError:
+        logger.warning(f"Config file {config_path} not found, using defaults")
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+# Prompt templates. Static instructions and output formats come first and per-call
+# data last, so calls share a byte-identical prefix (reused by vLLM prefix caching).
+# The CV analysis prompt is split into segments: the instructions and the job
+# description, which are shared by every candidate screened against the same job,
+# are tokenized once and reused.
+_CV_ANALYSIS_INSTRUCTIONS = """
+Analyze the CV below against the job description and provide a structured evaluation.
+
+Please provide your analysis in the following JSON format:
+{
+    "overall_score": 0-100,
+    "skill_match": {
+        "required_skills": ["skill1", "skill2"],
+        "missing_skills": ["skill3", "skill4"],
+        "skill_match_percentage": 0-100
+    },
+    "experience_assessment": {
+        "years_experience": "estimated_years",
+        "relevant_experience": "yes/no",
+        "experience_score": 0-100
+    },
+    "recommendations": ["recommendation1", "recommendation2"],
+    "confidence": 0-100
+}
+"""
+
+_CV_ANALYSIS_JOB = Template("""
+Job Description:
+$job_description
+""")
+
+_CV_ANALYSIS_CV = Template("""
+CV:
+$cv_text
+""")
+
+_INTERVIEW_SCORING_TEMPLATE = Template("""
+Score the interview response below based on the given criteria.
+
+Please provide your scoring in the following JSON format:
+{
+    "overall_score": 1-10,
+    "criteria_scores": {
+        "technical_knowledge": 1-10,
+        "communication": 1-10,
+        "problem_solving": 1-10,
+        "cultural_fit": 1-10
+    },
+    "strengths": ["strength1", "strength2"],
+    "weaknesses": ["weakness1", "weakness2"],
+    "feedback": "detailed_feedback_here",
+    "recommendation": "hire/consider/reject"
+}
+
+Criteria: $criteria
+Question: $question
+Response: $response
+""")
+
+_REPORT_TEMPLATE = Template("""
+Generate a comprehensive candidate evaluation report based on the data below.
+
+Please create a professional report that includes:
+1. Executive Summary
+2. Technical Assessment
+3. Interview Performance
+4. Overall Recommendation
+5. Next Steps
+
+Format the report in Markdown.
+
+CV Analysis: $cv_analysis
+Interview Scores: $interview_scores
+""")
+
 
 class LLMClient:
     """
@@ -19,6 +164,9 @@ class LLMClient:
     
     Supports both instruction-tuned models (like Mistral) and conversational models
     (like DialoGPT) for different evaluation tasks.
+    
+    A single client may be shared between threads; calls into the model are
+    serialized with an internal lock.
     """
     
     def __init__(self, config_path: str = "config/config.yaml"):
@@ -31,33 +179,53 @@ class LLMClient:
         self.config = self._load_config(config_path)
         self.model = None
         self.tokenizer = None
+        self.engine = None
+        self._generate_lock = threading.Lock()
         self.device = self._setup_device()
-        self._load_model()
+        self.response_cache = self._build_response_cache()
+        
+        # Token ids of static prompt segments, keyed by (text, add_special_tokens)
+        self._segment_ids: Dict[Tuple[str, bool], torch.Tensor] = {}
+        
+        backend = self.config['model'].get('backend', 'hf')
+        if backend == 'vllm':
+            self._load_vllm_engine()
+        else:
+            self._load_model()
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
-        except FileNotFoundError:
-            logger.warning(f"Config file {config_path} not found, using defaults")
-            return self._get_default_config()
+        return load_config(config_path)
     
     def _get_default_config(self) -> Dict:
         """Return default configuration if config file is missing."""
-        return {
-            'model': {
-                'name': 'microsoft/DialoGPT-medium',
-                'max_length': 1024,
-                'temperature': 0.7,
-                'top_p': 0.9,
-                'do_sample': True
-            },
-            'hardware': {
-                'use_gpu': False,
-                'batch_size': 1
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    
+    def _build_response_cache(self) -> Optional[ResponseCache]:
+        """Create the LLM response cache from the ``response_cache`` config section."""
+        cache_config = self.config.get('response_cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        
+        try:
+            return ResponseCache(
+                cache_config.get('directory', '~/.cache/candidate_eval/llm'),
+                CachePolicy(expiry=cache_config.get('expiry', '1W'))
+            )
+        except Exception as e:
+            logger.warning(f"LLM response cache disabled: {e}")
+            return None
+    
+    def clear_cache(self) -> int:
+        """
+        Remove all cached LLM responses.
+        
+        Returns:
+            Number of removed cache entries
+        """
+        if self.response_cache is None:
+            return 0
+        return self.response_cache.clear()
     
     def _setup_device(self) -> str:
         """Setup the device (CPU/GPU) for model inference."""
@@ -76,36 +244,162 @@ class LLMClient:
             logger.info(f"Loading model: {model_name}")
             
             # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.tokenizer = self._load_tokenizer(model_name)
             
-            # Add padding token if not present
-            if self.tokenizer.pad_token is None:
-                self.tokenizer.pad_token = self.tokenizer.eos_token
+            self._configure_tokenizer_padding()
             
             # Load model
-            self.model = AutoModelForCausalLM.from_pretrained(
-                model_name,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-                device_map="auto" if self.device == "cuda" else None,
-                low_cpu_mem_usage=True
-            )
+            model_kwargs = {
+                "torch_dtype": self._resolve_dtype(),
+                "device_map": "auto" if self.device == "cuda" else None,
+                "low_cpu_mem_usage": True
+            }
+            
+            quantization_config = self._build_quantization_config()
+            if quantization_config is not None:
+                model_kwargs["quantization_config"] = quantization_config
+            
+            self.model = self._from_pretrained_with_attention(model_name, model_kwargs)
             
+            # With device_map="auto" accelerate/bitsandbytes place the layers themselves
             if self.device == "cpu":
                 self.model = self.model.to(self.device)
             
+            self._compile_model()
+            
             logger.success(f"Model {model_name} loaded successfully")
             
         except Exception as e:
             logger.error(f"Failed to load primary model: {e}")
             self._load_fallback_model()
     
+    def _compile_model(self):
+        """
+        Compile the model forward pass with ``torch.compile`` when ``model.compile`` is enabled.
+        
+        A static KV cache keeps the decode step at a fixed shape per prompt
+        bucket, so "reduce-overhead" mode can replay each step as a captured
+        CUDA graph instead of launching kernels from Python token by token.
+        """
+        if not self.config['model'].get('compile', False):
+            return
+        
+        if self.device != "cuda":
+            logger.info("Skipping torch.compile: CUDA graphs are only available on GPU")
+            return
+        
+        try:
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(
+                self.model.forward, mode="reduce-overhead", fullgraph=False, dynamic=False
+            )
+            logger.info("Model forward pass compiled with torch.compile (reduce-overhead)")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, running the model eagerly: {e}")
+    
+    def _load_vllm_engine(self):
+        """Load the vLLM engine, falling back to Hugging Face if it is unavailable."""
+        try:
+            from src.models.vllm_client import VLLMClient
+            self.engine = VLLMClient(self.config)
+        except Exception as e:
+            logger.error(f"Failed to load vLLM backend, using Hugging Face instead: {e}")
+            self.engine = None
+            self._load_model()
+    
+    def _resolve_attn_implementation(self) -> str:
+        """Pick the fastest attention kernel available on the current device."""
+        # FlashAttention-2 needs an Ampere (compute capability 8.x) or newer GPU
+        if self.device == "cuda" and torch.cuda.get_device_capability()[0] >= 8:
+            return "flash_attention_2"
+        
+        # PyTorch scaled-dot-product attention works on CPU and older GPUs
+        return "sdpa"
+    
+    def _from_pretrained_with_attention(self, model_name: str, model_kwargs: Dict):
+        """
+        Load a model with the preferred attention kernel, degrading gracefully.
+        
+        Args:
+            model_name: Hugging Face model identifier
+            model_kwargs: Keyword arguments for ``from_pretrained``
+            
+        Returns:
+            Loaded model
+        """
+        candidates = [self._resolve_attn_implementation(), "sdpa", None]
+        
+        for attn_implementation in dict.fromkeys(candidates):
+            kwargs = dict(model_kwargs)
+            if attn_implementation is not None:
+                kwargs["attn_implementation"] = attn_implementation
+            
+            try:
+                model = AutoModelForCausalLM.from_pretrained(model_name, **kwargs)
+                logger.info(f"Using attention implementation: {attn_implementation or 'default'}")
+                return model
+            except (ImportError, ValueError) as e:
+                if attn_implementation is None:
+                    raise
+                logger.warning(f"Attention implementation '{attn_implementation}' unavailable: {e}")
+    
+    def _resolve_dtype(self) -> torch.dtype:
+        """Pick the weight dtype for the current device."""
+        if self.device != "cuda":
+            return torch.float32
+        
+        # bfloat16 has the same memory traffic as float16 but a wider exponent range
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+    
+    def _build_quantization_config(self):
+        """
+        Build a bitsandbytes quantization config from ``model.quantization``.
+        
+        Returns:
+            BitsAndBytesConfig instance, or None when quantization is disabled
+        """
+        quantization = str(self.config['model'].get('quantization', 'none')).lower()
+        if quantization in ("none", "", "false"):
+            return None
+        
+        if self.device != "cuda":
+            logger.warning(f"Quantization '{quantization}' requires a GPU, loading unquantized weights")
+            return None
+        
+        try:
+            import bitsandbytes  # noqa: F401
+        except ImportError:
+            logger.warning(f"bitsandbytes is not installed, ignoring quantization '{quantization}'")
+            return None
+        
+        from transformers import BitsAndBytesConfig
+        
+        if quantization == "int8":
+            logger.info("Loading model with 8-bit quantization")
+            return BitsAndBytesConfig(load_in_8bit=True)
+        
+        if quantization == "int4":
+            logger.info("Loading model with 4-bit NF4 quantization")
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=self._resolve_dtype(),
+                bnb_4bit_use_double_quant=True
+            )
+        
+        logger.warning(f"Unknown quantization mode '{quantization}', loading unquantized weights")
+        return None
+    
     def _load_fallback_model(self):
         """Load a smaller fallback model if the primary model fails."""
         try:
             fallback_model = self.config['model'].get('alternative_model', 'microsoft/DialoGPT-medium')
             logger.info(f"Loading fallback model: {fallback_model}")
             
-            self.tokenizer = AutoTokenizer.from_pretrained(fallback_model)
+            self.tokenizer = self._load_tokenizer(fallback_model)
+            self._configure_tokenizer_padding()
             self.model = AutoModelForCausalLM.from_pretrained(fallback_model)
             
             if self.device == "cpu":
@@ -117,58 +411,450 @@ class LLMClient:
             logger.error(f"Failed to load fallback model: {e}")
             raise RuntimeError("No models could be loaded")
     
-    def generate_response(self, prompt: str, max_new_tokens: Optional[int] = None) -> str:
+    def _load_tokenizer(self, model_name: str):
+        """
+        Load the fast (Rust) tokenizer for a model, falling back to the slow one loudly.
+        
+        Args:
+            model_name: Name or path of the model
+            
+        Returns:
+            Loaded tokenizer
+        """
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        except Exception as e:
+            logger.warning(
+                f"Fast tokenizer unavailable for {model_name} ({e}); falling back to the "
+                f"slow Python tokenizer, tokenization will be much slower"
+            )
+            return AutoTokenizer.from_pretrained(model_name, use_fast=False)
+        
+        if not getattr(tokenizer, "is_fast", False):
+            logger.warning(
+                f"No fast tokenizer available for {model_name}; using the slow Python "
+                f"tokenizer, tokenization will be much slower"
+            )
+        
+        return tokenizer
+    
+    def _configure_tokenizer_padding(self):
+        """Configure the tokenizer for batched generation with a causal LM."""
+        # Add padding token if not present
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        
+        # Decoder-only models must be left-padded so generation continues
+        # directly from the last prompt token of every row
+        self.tokenizer.padding_side = "left"
+    
+    def _repetition_penalty(self, repetition_penalty: Optional[float] = None) -> float:
+        """Resolve the repetition penalty of a request (``model.repetition_penalty`` by default)."""
+        if repetition_penalty is None:
+            return self.config['model'].get('repetition_penalty', 1.1)
+        return repetition_penalty
+    
+    def _generation_kwargs(self, max_new_tokens: Optional[int],
+                           repetition_penalty: Optional[float] = None) -> Dict:
+        """Build the keyword arguments passed to ``model.generate``."""
+        # Use config max_new_tokens if not specified
+        if max_new_tokens is None:
+            max_new_tokens = self.config['model']['max_new_tokens']
+        
+        kwargs = {
+            "max_new_tokens": max_new_tokens,
+            "temperature": self.config['model']['temperature'],
+            "top_p": self.config['model']['top_p'],
+            "do_sample": self.config['model']['do_sample'],
+            "pad_token_id": self.tokenizer.pad_token_id,
+            "eos_token_id": self.tokenizer.eos_token_id,
+            "use_cache": True
+        }
+        
+        # A penalty of 1.0 is a no-op; leaving it out skips the logits processor entirely
+        repetition_penalty = self._repetition_penalty(repetition_penalty)
+        if repetition_penalty != 1.0:
+            kwargs["repetition_penalty"] = repetition_penalty
+        
+        return kwargs
+    
+    def _use_response_cache(self, cache: bool) -> bool:
+        """Check whether a generation request may be served from the response cache."""
+        if not cache or self.response_cache is None:
+            return False
+        
+        # Sampled outputs are not reproducible, so only cache them on request
+        if self.config['model'].get('do_sample', False):
+            return self.config.get('response_cache', {}).get('cache_sampled', False)
+        return True
+    
+    def _response_cache_key(self, prompt, max_new_tokens: Optional[int],
+                            repetition_penalty: Optional[float] = None) -> str:
+        """Build the response cache key for a prompt (or its consecutive parts)."""
+        model_config = self.config['model']
+        if max_new_tokens is None:
+            max_new_tokens = model_config['max_new_tokens']
+        
+        return ResponseCache.make_key(
+            model_config['name'], prompt, model_config['temperature'],
+            model_config['top_p'], model_config['do_sample'], max_new_tokens,
+            self._repetition_penalty(repetition_penalty)
+        )
+    
+    def generate_response(self, prompt: str, max_new_tokens: Optional[int] = None,
+                          cache: bool = True, repetition_penalty: Optional[float] = None) -> str:
         """
         Generate a response using the loaded model.
         
         Args:
             prompt: Input prompt for the model
             max_new_tokens: Maximum number of new tokens to generate
+            cache: Whether to use the response cache for this request
+            repetition_penalty: Repetition penalty override (defaults to ``model.repetition_penalty``)
             
         Returns:
             Generated response text
         """
-        try:
-            # Use config max_new_tokens if not specified
-            if max_new_tokens is None:
-                max_new_tokens = self.config['model']['max_new_tokens']
-            
-            # Tokenize input with proper truncation and attention mask
-            inputs = self.tokenizer.encode(prompt, return_tensors="pt", truncation=True, max_length=2048)
-            
-            # Create attention mask
-            attention_mask = torch.ones_like(inputs)
-            
-            if self.device == "cuda":
-                inputs = inputs.to(self.device)
-                attention_mask = attention_mask.to(self.device)
-            
-            # Generate response
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    inputs,
-                    attention_mask=attention_mask,
-                    max_new_tokens=max_new_tokens,
-                    temperature=self.config['model']['temperature'],
-                    top_p=self.config['model']['top_p'],
-                    do_sample=self.config['model']['do_sample'],
-                    pad_token_id=self.tokenizer.eos_token_id,
-                    eos_token_id=self.tokenizer.eos_token_id,
-                    repetition_penalty=1.1,
-                    length_penalty=1.0
+        def generate() -> str:
+            if self.engine is not None:
+                return self.engine.generate_response(
+                    prompt, max_new_tokens, self._repetition_penalty(repetition_penalty)
                 )
+            return self._generate_single(prompt, max_new_tokens, repetition_penalty)
+        
+        return self._generate_cached((prompt,), generate, max_new_tokens, cache, repetition_penalty)
+    
+    def _generate_cached(self, segments: Tuple[str, ...], generate, max_new_tokens: Optional[int],
+                         cache: bool, repetition_penalty: Optional[float] = None) -> str:
+        """
+        Serve a prompt from the response cache or generate and store it.
+        
+        Args:
+            segments: Consecutive parts of the prompt
+            generate: Callable producing the response on a cache miss
+            max_new_tokens: Maximum number of new tokens to generate
+            cache: Whether to use the response cache for this request
+            repetition_penalty: Repetition penalty override used for the request
             
-            # Decode response
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
-            # Remove the input prompt from the response
-            response = response[len(prompt):].strip()
-            
-            return response
+        Returns:
+            Generated response text
+        """
+        cache_key = (
+            self._response_cache_key(segments, max_new_tokens, repetition_penalty)
+            if self._use_response_cache(cache) else None
+        )
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Serving LLM response from cache")
+                return cached
+        
+        try:
+            response = generate()
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
             return f"Error: {str(e)}"
+        
+        if cache_key is not None:
+            self.response_cache.set(cache_key, "".join(segments), response)
+        
+        return response
+    
+    def generate_from_segments(self, segments: Tuple[str, ...], variable_index: int,
+                               max_new_tokens: Optional[int] = None, cache: bool = True) -> str:
+        """
+        Generate a response for a prompt given as consecutive text segments.
+        
+        All segments except ``variable_index`` are treated as static: their
+        token ids are cached, so only the variable segment is tokenized per
+        call. The concatenated prompt is clamped to ``_MAX_PROMPT_TOKENS``: the
+        variable segment gets what the static segments leave, and if they alone
+        exceed the budget the prompt is cut on the right like a truncated whole
+        prompt.
+        
+        Segments are tokenized independently, so no token spans a segment join.
+        The prompt templates start and end every segment with a newline, where
+        byte-level BPE tokenizers (GPT-2/DialoGPT) split pre-tokens anyway, so
+        the ids match those of the joined prompt. Tokenizers that merge across
+        newlines or add a prefix space (SentencePiece) may differ at the joins.
+        
+        Args:
+            segments: Consecutive parts of the prompt
+            variable_index: Index of the segment that changes between calls
+            max_new_tokens: Maximum number of new tokens to generate
+            cache: Whether to use the response cache for this request
+            
+        Returns:
+            Generated response text
+        """
+        def generate() -> str:
+            if self.engine is not None:
+                return self.engine.generate_response(
+                    "".join(segments), max_new_tokens, self._repetition_penalty()
+                )
+            
+            segment_ids = []
+            for index, segment in enumerate(segments):
+                if index != variable_index:
+                    segment_ids.append(self._encode_segment(segment, index == 0))
+            
+            # Give the variable segment whatever is left of the context budget
+            budget = max(0, _MAX_PROMPT_TOKENS - sum(ids.shape[0] for ids in segment_ids))
+            variable_ids = self.tokenizer(
+                segments[variable_index], add_special_tokens=variable_index == 0,
+                return_tensors="pt"
+            )["input_ids"][0][:budget]
+            segment_ids.insert(variable_index, variable_ids)
+            
+            # Static segments alone may exceed the budget; clamp the whole prompt
+            input_ids = torch.cat(segment_ids)[:_MAX_PROMPT_TOKENS].unsqueeze(0)
+            outputs = self._generate_from_ids(input_ids, torch.ones_like(input_ids), max_new_tokens)
+            
+            return self._decode_new_tokens(outputs, input_ids.shape[1])[0]
+        
+        return self._generate_cached(tuple(segments), generate, max_new_tokens, cache)
+    
+    def _encode_segment(self, text: str, add_special_tokens: bool) -> torch.Tensor:
+        """Tokenize a static prompt segment into a 1-D tensor of token ids, reusing earlier results."""
+        key = (text, add_special_tokens)
+        ids = self._segment_ids.get(key)
+        if ids is None:
+            ids = self.tokenizer(
+                text, add_special_tokens=add_special_tokens, return_tensors="pt"
+            )["input_ids"][0]
+            
+            # Static segments are few (the instructions and one per job description);
+            # start over rather than grow without bound
+            if len(self._segment_ids) >= _MAX_CACHED_SEGMENTS:
+                self._segment_ids.clear()
+            self._segment_ids[key] = ids
+        
+        return ids
+    
+    def _generate_single(self, prompt: str, max_new_tokens: Optional[int] = None,
+                         repetition_penalty: Optional[float] = None) -> str:
+        """
+        Generate a response for one prompt with the Hugging Face model.
+        
+        Args:
+            prompt: Input prompt for the model
+            max_new_tokens: Maximum number of new tokens to generate
+            repetition_penalty: Repetition penalty override
+            
+        Returns:
+            Generated response text
+        """
+        # Tokenize input; the attention mask comes from the tokenizer
+        encoded = self.tokenizer(
+            prompt, return_tensors="pt", truncation=True, max_length=_MAX_PROMPT_TOKENS,
+            return_attention_mask=True
+        )
+        
+        outputs = self._generate_from_ids(
+            encoded["input_ids"], encoded["attention_mask"], max_new_tokens, repetition_penalty
+        )
+        
+        return self._decode_new_tokens(outputs, encoded["input_ids"].shape[1])[0]
+    
+    def _decode_new_tokens(self, outputs: torch.Tensor, prompt_length: int) -> List[str]:
+        """
+        Decode the generated part of every output row.
+        
+        Prompts are left-padded to a common length, so the new tokens of every
+        row start at the same column and are sliced off in one tensor operation.
+        
+        Args:
+            outputs: Generated token ids of shape (batch, prompt_length + new_tokens)
+            prompt_length: Number of (padded) prompt tokens per row
+            
+        Returns:
+            Decoded response texts, one per row
+        """
+        generated = outputs[:, prompt_length:].cpu()
+        responses = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+        return [response.strip() for response in responses]
+    
+    def _generate_from_ids(self, input_ids: torch.Tensor, attention_mask: torch.Tensor,
+                           max_new_tokens: Optional[int] = None,
+                           repetition_penalty: Optional[float] = None) -> torch.Tensor:
+        """
+        Run the model on already tokenized inputs.
+        
+        Args:
+            input_ids: Prompt token ids
+            attention_mask: Attention mask matching ``input_ids``
+            max_new_tokens: Maximum number of new tokens to generate
+            repetition_penalty: Repetition penalty override
+            
+        Returns:
+            Generated token ids, including the prompt tokens
+        """
+        input_ids = input_ids.to(self.device)
+        attention_mask = attention_mask.to(self.device)
+        
+        with self._generate_lock, torch.no_grad():
+            return self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                **self._generation_kwargs(max_new_tokens, repetition_penalty)
+            )
+    
+    def generate_responses(self, prompts: List[str], max_new_tokens: Optional[int] = None,
+                           output_length_hint: Optional[List[int]] = None,
+                           cache: bool = True) -> List[str]:
+        """
+        Generate responses for several prompts using batched model calls.
+        
+        Prompts are grouped into length buckets of ``hardware.batch_size`` so
+        that each batch carries as little padding as possible. Cached prompts
+        are served from the response cache and skipped by the model.
+        
+        Args:
+            prompts: Input prompts for the model
+            max_new_tokens: Maximum number of new tokens to generate per prompt
+            output_length_hint: Expected number of output tokens per prompt (optional)
+            cache: Whether to use the response cache for these requests
+            
+        Returns:
+            Generated response texts, in the same order as the prompts
+        """
+        responses = [None] * len(prompts)
+        use_cache = self._use_response_cache(cache)
+        
+        # Token limit of each prompt: its own hint on the HF path (bins never mix hints)
+        use_hints = output_length_hint is not None and self.engine is None
+        limits = [output_length_hint[i] if use_hints else max_new_tokens for i in range(len(prompts))]
+        
+        if use_cache:
+            responses = [
+                self.response_cache.get(self._response_cache_key(prompt, limits[i]))
+                for i, prompt in enumerate(prompts)
+            ]
+        
+        pending = [i for i, response in enumerate(responses) if response is None]
+        if not pending:
+            return responses
+        
+        pending_prompts = [prompts[i] for i in pending]
+        pending_hints = [output_length_hint[i] for i in pending] if output_length_hint else None
+        
+        if self.engine is not None:
+            # vLLM schedules and batches requests itself
+            try:
+                generated = self.engine.generate_responses(
+                    pending_prompts, max_new_tokens, self._repetition_penalty()
+                )
+                failed = set()
+            except Exception as e:
+                logger.error(f"Error generating batched responses: {e}")
+                generated = [f"Error: {str(e)}"] * len(pending_prompts)
+                failed = set(range(len(pending_prompts)))
+        else:
+            bin_size = self.config['hardware'].get('batch_size', 8)
+            generated, failed = self._batched_generate_bucketed(
+                pending_prompts, bin_size, pending_hints, max_new_tokens
+            )
+        
+        for position, (index, response) in enumerate(zip(pending, generated)):
+            responses[index] = response
+            if use_cache and position not in failed:
+                cache_key = self._response_cache_key(prompts[index], limits[index])
+                self.response_cache.set(cache_key, prompts[index], response)
+        
+        return responses
+    
+    def _batched_generate_bucketed(self, prompts: List[str], bin_size: int = 8,
+                                   output_length_hint: Optional[List[int]] = None,
+                                   max_new_tokens: Optional[int] = None
+                                   ) -> Tuple[List[str], Set[int]]:
+        """
+        Sort prompts by length, generate them in fixed-size bins and restore the order.
+        
+        Prompts with different output length hints never share a bin, so each
+        prompt is generated with exactly its own hint.
+        
+        Args:
+            prompts: Input prompts for the model
+            bin_size: Maximum number of prompts per batched model call
+            output_length_hint: Expected number of output tokens per prompt (optional)
+            max_new_tokens: Maximum number of new tokens when no hint is given
+            
+        Returns:
+            Generated response texts in the original order and the indices of
+            prompts whose bin failed (their text is an error message)
+        """
+        if not prompts:
+            return [], set()
+        
+        bin_size = max(1, bin_size)
+        if len(prompts) <= bin_size and output_length_hint is None:
+            order = list(range(len(prompts)))
+            hints = None
+        else:
+            try:
+                # Measure prompt lengths without padding
+                lengths = [
+                    len(ids) for ids in
+                    self.tokenizer(prompts, truncation=True, max_length=_MAX_PROMPT_TOKENS)["input_ids"]
+                ]
+            except Exception as e:
+                logger.warning(f"Could not measure prompt lengths, using character counts: {e}")
+                lengths = [len(prompt) for prompt in prompts]
+            
+            # Bucket by expected output length first, then by prompt length
+            hints = output_length_hint or [0] * len(prompts)
+            order = sorted(range(len(prompts)), key=lambda i: (hints[i], lengths[i]))
+        
+        # Split the sorted prompts into runs of equal hint, then into bins
+        bins = []
+        for _, run in groupby(order, key=lambda i: hints[i] if hints else None):
+            run = list(run)
+            bins.extend(run[start:start + bin_size] for start in range(0, len(run), bin_size))
+        
+        responses = [""] * len(prompts)
+        failed = set()
+        for bin_indices in bins:
+            bin_max_new_tokens = hints[bin_indices[0]] if output_length_hint else max_new_tokens
+            
+            try:
+                bin_responses = self._generate_batch([prompts[i] for i in bin_indices], bin_max_new_tokens)
+            except Exception as e:
+                logger.error(f"Error generating batched responses: {e}")
+                bin_responses = [f"Error: {str(e)}"] * len(bin_indices)
+                failed.update(bin_indices)
+            
+            # Un-permute results back to the original order
+            for index, response in zip(bin_indices, bin_responses):
+                responses[index] = response
+        
+        return responses, failed
+    
+    def _generate_batch(self, prompts: List[str], max_new_tokens: Optional[int] = None) -> List[str]:
+        """
+        Generate responses for a batch of prompts with a single model call.
+        
+        Args:
+            prompts: Input prompts for the model
+            max_new_tokens: Maximum number of new tokens to generate per prompt
+            
+        Returns:
+            Generated response texts, in the same order as the prompts
+        """
+        if not prompts:
+            return []
+        
+        # Tokenize the whole batch; left padding keeps prompts right-aligned
+        encoded = self.tokenizer(
+            prompts, return_tensors="pt", padding=True, truncation=True, max_length=_MAX_PROMPT_TOKENS
+        )
+        
+        # Generate all responses at once
+        outputs = self._generate_from_ids(
+            encoded["input_ids"], encoded["attention_mask"], max_new_tokens
+        )
+        
+        return self._decode_new_tokens(outputs, encoded["input_ids"].shape[1])
     
     def analyze_cv(self, cv_text: str, job_description: str) -> Dict:
         """
@@ -181,34 +867,15 @@ class LLMClient:
         Returns:
             Dictionary containing analysis results
         """
-        prompt = f"""
-        Analyze the following CV against the job description and provide a structured evaluation.
-        
-        CV:
-        {cv_text}
-        
-        Job Description:
-        {job_description}
-        
-        Please provide your analysis in the following JSON format:
-        {{
-            "overall_score": 0-100,
-            "skill_match": {{
-                "required_skills": ["skill1", "skill2"],
-                "missing_skills": ["skill3", "skill4"],
-                "skill_match_percentage": 0-100
-            }},
-            "experience_assessment": {{
-                "years_experience": "estimated_years",
-                "relevant_experience": "yes/no",
-                "experience_score": 0-100
-            }},
-            "recommendations": ["recommendation1", "recommendation2"],
-            "confidence": 0-100
-        }}
-        """
-        
-        response = self.generate_response(prompt)
+        # Static instructions, then the job description, then the CV: candidates
+        # screened for one job share everything but the final segment
+        segments = (
+            _CV_ANALYSIS_INSTRUCTIONS,
+            _CV_ANALYSIS_JOB.substitute(job_description=job_description),
+            _CV_ANALYSIS_CV.substitute(cv_text=cv_text)
+        )
+        
+        response = self.generate_from_segments(segments, variable_index=2)
         return self._parse_json_response(response)
     
     def score_interview_response(self, question: str, response: str, criteria: List[str]) -> Dict:
@@ -223,30 +890,12 @@ class LLMClient:
         Returns:
             Dictionary containing scoring results
         """
-        criteria_str = ", ".join(criteria)
-        prompt = f"""
-        Score the following interview response based on the criteria: {criteria_str}
-        
-        Question: {question}
-        Response: {response}
-        
-        Please provide your scoring in the following JSON format:
-        {{
-            "overall_score": 1-10,
-            "criteria_scores": {{
-                "technical_knowledge": 1-10,
-                "communication": 1-10,
-                "problem_solving": 1-10,
-                "cultural_fit": 1-10
-            }},
-            "strengths": ["strength1", "strength2"],
-            "weaknesses": ["weakness1", "weakness2"],
-            "feedback": "detailed_feedback_here",
-            "recommendation": "hire/consider/reject"
-        }}
-        """
-        
-        response_text = self.generate_response(prompt)
+        prompt = _INTERVIEW_SCORING_TEMPLATE.substitute(
+            criteria=", ".join(criteria), question=question, response=response
+        )
+        
+        # Short structured output: the repetition penalty only costs time here
+        response_text = self.generate_response(prompt, repetition_penalty=1.0)
         return self._parse_json_response(response_text)
     
     def generate_report(self, cv_analysis: Dict, interview_scores: Dict) -> str:
@@ -260,23 +909,49 @@ class LLMClient:
         Returns:
             Formatted report text
         """
-        prompt = f"""
-        Generate a comprehensive candidate evaluation report based on the following data:
+        prompt = _REPORT_TEMPLATE.substitute(
+            cv_analysis=cv_analysis, interview_scores=interview_scores
+        )
         
-        CV Analysis: {cv_analysis}
-        Interview Scores: {interview_scores}
-        
-        Please create a professional report that includes:
-        1. Executive Summary
-        2. Technical Assessment
-        3. Interview Performance
-        4. Overall Recommendation
-        5. Next Steps
+        return self.generate_response(prompt)
+    
+    @staticmethod
+    def _find_json_object(text: str) -> Optional[str]:
+        """
+        Locate the first balanced JSON object in a text with a single linear scan.
         
-        Format the report in Markdown.
+        Args:
+            text: Text that may contain a JSON object
+            
+        Returns:
+            Substring holding the JSON object, or None if no balanced object is found
         """
+        start = text.find('{')
+        if start == -1:
+            return None
         
-        return self.generate_response(prompt)
+        depth = 0
+        in_string = False
+        escaped = False
+        for index in range(start, len(text)):
+            char = text[index]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:index + 1]
+        
+        return None
     
     def _parse_json_response(self, response: str) -> Dict:
         """
@@ -288,20 +963,17 @@ class LLMClient:
         Returns:
             Parsed dictionary or fallback text
         """
+        # Find the first complete JSON object in the response
+        json_str = self._find_json_object(response)
+        if json_str is None:
+            return {"raw_response": response, "parse_error": "No JSON found"}
+        
         try:
-            # Try to extract JSON from the response
-            import json
-            import re
-            
-            # Find JSON-like content in the response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                return json.loads(json_str)
-            else:
-                return {"raw_response": response, "parse_error": "No JSON found"}
-                
-        except json.JSONDecodeError:
+            if orjson is not None:
+                return orjson.loads(json_str)
+            return json.loads(json_str)
+            
+        except ValueError:
             logger.warning("Failed to parse JSON response, returning raw text")
             return {"raw_response": response, "parse_error": "Invalid JSON"}
     
@@ -309,6 +981,7 @@ class LLMClient:
         """Get information about the loaded model."""
         return {
             "model_name": self.config['model']['name'],
+            "backend": "vllm" if self.engine is not None else "hf",
             "device": self.device,
             "max_length": self.config['model']['max_length'],
             "temperature": self.config['model']['temperature']
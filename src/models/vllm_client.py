@@ -0,0 +1,98 @@
+"""
+vLLM Client for Candidate Evaluation System
+
+This module provides a vLLM-backed generation engine. vLLM performs continuous
+batching and paged KV-cache management internally, so any number of prompts can
+be handed to a single ``generate`` call.
+"""
+
+from typing import Dict, List, Optional
+from loguru import logger
+from vllm import LLM, SamplingParams
+
+
+class VLLMClient:
+    """
+    Generation engine backed by vLLM.
+    
+    Used by ``LLMClient`` when ``model.backend`` is set to ``"vllm"``; exposes the
+    same ``generate_response`` / ``generate_responses`` surface as the Hugging Face path.
+    """
+    
+    def __init__(self, config: Dict):
+        """
+        Initialize the vLLM engine from the evaluation system configuration.
+        
+        Args:
+            config: Parsed configuration dictionary
+        """
+        self.config = config
+        model_config = config['model']
+        self.model_name = model_config['name']
+        
+        logger.info(f"Loading model with vLLM: {self.model_name}")
+        
+        self.llm = LLM(
+            model=self.model_name,
+            dtype=model_config.get('vllm_dtype', 'bfloat16'),
+            gpu_memory_utilization=model_config.get('gpu_memory_utilization', 0.9),
+            max_model_len=model_config.get('max_model_len', 2048),
+            enable_prefix_caching=True
+        )
+        
+        logger.success(f"vLLM model {self.model_name} loaded successfully")
+    
+    def _sampling_params(self, max_new_tokens: Optional[int] = None,
+                         repetition_penalty: float = 1.1) -> SamplingParams:
+        """Build vLLM sampling parameters from the model configuration."""
+        model_config = self.config['model']
+        
+        if max_new_tokens is None:
+            max_new_tokens = model_config['max_new_tokens']
+        
+        # vLLM has no do_sample flag; greedy decoding is temperature 0
+        temperature = model_config['temperature'] if model_config.get('do_sample', True) else 0.0
+        
+        return SamplingParams(
+            temperature=temperature,
+            top_p=model_config['top_p'],
+            max_tokens=max_new_tokens,
+            repetition_penalty=repetition_penalty
+        )
+    
+    def generate_response(self, prompt: str, max_new_tokens: Optional[int] = None,
+                          repetition_penalty: float = 1.1) -> str:
+        """
+        Generate a response for a single prompt.
+        
+        Args:
+            prompt: Input prompt for the model
+            max_new_tokens: Maximum number of new tokens to generate
+            repetition_penalty: Repetition penalty (1.0 disables it)
+            
+        Returns:
+            Generated response text
+        """
+        return self.generate_responses([prompt], max_new_tokens, repetition_penalty)[0]
+    
+    def generate_responses(self, prompts: List[str], max_new_tokens: Optional[int] = None,
+                           repetition_penalty: float = 1.1) -> List[str]:
+        """
+        Generate responses for several prompts with one vLLM call.
+        
+        The repetition penalty is applied by vLLM as one vectorized operation
+        over the whole batch.
+        
+        Args:
+            prompts: Input prompts for the model
+            max_new_tokens: Maximum number of new tokens to generate per prompt
+            repetition_penalty: Repetition penalty (1.0 disables it)
+            
+        Returns:
+            Generated response texts, in the same order as the prompts
+        """
+        if not prompts:
+            return []
+        
+        outputs = self.llm.generate(prompts, self._sampling_params(max_new_tokens, repetition_penalty))
+        return [output.outputs[0].text.strip() for output in outputs]
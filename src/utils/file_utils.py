@@ -6,15 +6,148 @@ including PDFs, Word documents, and text files for CVs and job descriptions.
 """
 
 import os
+import io
+import asyncio
 import json
-import yaml
-from typing import Dict, List, Optional, Union
+import hashlib
+import mmap
+import multiprocessing
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import ClassVar, Dict, FrozenSet, Iterable, List, Optional, Set, Union
 from pathlib import Path
-import PyPDF2
-from docx import Document
-import pandas as pd
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _import_pdfium():
+    """Import pypdfium2 on first use; returns None when it is not installed."""
+    try:
+        import pypdfium2
+        return pypdfium2
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _import_fitz():
+    """Import PyMuPDF on first use; returns None when it is not installed."""
+    try:
+        import fitz
+        return fitz
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _import_aiofiles():
+    """Import aiofiles on first use; returns None when it is not installed."""
+    try:
+        import aiofiles
+        return aiofiles
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _import_etree():
+    """Import lxml.etree on first use; returns None when it is not installed."""
+    try:
+        from lxml import etree
+        return etree
+    except ImportError:
+        return None
+
+
+def _json_default(obj):
+    """Convert numpy arrays and scalars for the stdlib encoder (orjson handles them natively)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json_bytes(data, indent: Optional[int] = 2) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when the indentation allows it."""
+    if orjson is not None and indent in (None, 0, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # Types orjson does not handle (e.g. integers beyond 64 bits)
+            pass
+    return json.dumps(data, indent=indent or None, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+# Schemas of the JSON data files consumed by the evaluation pipeline
+_JSON_SCHEMAS = {
+    "interview_questions": {
+        "type": "object",
+        "required": ["questions"],
+        "properties": {
+            "questions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["id", "category", "question"],
+                    "properties": {
+                        "id": {"type": "string"},
+                        "category": {"type": "string"},
+                        "question": {"type": "string"},
+                        "expected_keywords": {"type": "array", "items": {"type": "string"}}
+                    }
+                }
+            }
+        }
+    },
+    "candidate_responses": {
+        "type": "object",
+        "required": ["candidate_id", "responses"],
+        "properties": {
+            "candidate_id": {"type": "string"},
+            "responses": {
+                "type": "object",
+                "additionalProperties": {"type": "string"}
+            }
+        }
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _get_json_validator(schema: str):
+    """Compile (once per process) the validator of a named JSON schema; None without fastjsonschema."""
+    try:
+        import fastjsonschema
+    except ImportError:
+        logger.warning("fastjsonschema is not installed, JSON files are loaded without validation")
+        return None
+    return fastjsonschema.compile(_JSON_SCHEMAS[schema])
+
+
+# Bump whenever extraction output changes so stale parse cache entries are ignored
+_PARSER_VERSION = 3
+
+# WordprocessingML namespace of paragraph (w:p) and text run (w:t) elements
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Text files at least this large are decoded straight from a memory map
+_MMAP_MIN_BYTES = 1 << 20
+
+# Extensions whose parsed text is cached (plain text is cheaper to read than to cache)
+_CACHED_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+
+def _read_one(base_path: str, file_path: str) -> str:
+    """Read a single file in a worker process (module-level so it can be pickled)."""
+    return FileUtils(base_path).read_file(file_path)
+
 
 class FileUtils:
     """
@@ -24,6 +157,12 @@ class FileUtils:
     and managing output files for analysis results.
     """
     
+    # Base paths whose directory layout has already been created in this process
+    _initialized_roots: ClassVar[Set[Path]] = set()
+    
+    # Extensions accepted for CVs and job descriptions (lower-case, as list_files expects)
+    _CV_EXTS: ClassVar[FrozenSet[str]] = frozenset({'.pdf', '.docx', '.txt'})
+    
     def __init__(self, base_path: str = "."):
         """
         Initialize FileUtils with base path.
@@ -32,7 +171,12 @@ class FileUtils:
             base_path: Base directory for file operations
         """
         self.base_path = Path(base_path)
-        self._ensure_directories()
+        self.parse_cache_dir = self.base_path / "outputs" / ".parse_cache"
+        
+        root = self.base_path.resolve()
+        if root not in FileUtils._initialized_roots:
+            self._ensure_directories()
+            FileUtils._initialized_roots.add(root)
     
     def _ensure_directories(self):
         """Create necessary directories if they don't exist."""
@@ -44,13 +188,14 @@ class FileUtils:
             "outputs/cv_analysis_results",
             "outputs/interview_scores",
             "outputs/final_reports",
+            "outputs/.parse_cache",
             "logs"
         ]
         
         for directory in directories:
             dir_path = self.base_path / directory
             dir_path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {dir_path}")
+            logger.debug("Ensured directory exists: {}", dir_path)
     
     def read_text_file(self, file_path: str) -> str:
         """
@@ -63,8 +208,18 @@ class FileUtils:
             File content as string
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size < _MMAP_MIN_BYTES:
+                    text = file.read().decode('utf-8')
+                else:
+                    # Decode from the page cache instead of first copying the file into a bytes object
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        text = str(mapped, 'utf-8')
+            
+            # Same newline handling as reading in text mode
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
         except Exception as e:
             logger.error(f"Error reading text file {file_path}: {e}")
             return ""
@@ -73,6 +228,9 @@ class FileUtils:
         """
         Extract text content from a PDF file.
         
+        Uses pypdfium2 when it is installed, then PyMuPDF, and finally PyPDF2
+        for documents neither native backend can open.
+        
         Args:
             file_path: Path to the PDF file
             
@@ -80,16 +238,65 @@ class FileUtils:
             Extracted text content
         """
         try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text.strip()
+            return self._extract_pdf_text(Path(file_path).read_bytes(), file_path)
         except Exception as e:
             logger.error(f"Error reading PDF file {file_path}: {e}")
             return ""
     
+    def _extract_pdf_text(self, data: bytes, file_path: str) -> str:
+        """
+        Extract text from the raw bytes of a PDF file.
+        
+        Args:
+            data: PDF file content
+            file_path: Path of the file (used for log messages)
+            
+        Returns:
+            Extracted text content
+        """
+        pdfium = _import_pdfium()
+        if pdfium is not None:
+            try:
+                return self._extract_pdf_text_pdfium(pdfium, data)
+            except Exception as e:
+                logger.warning(f"pypdfium2 could not read {file_path}, trying the next backend: {e}")
+        
+        fitz = _import_fitz()
+        if fitz is not None:
+            try:
+                with fitz.open(stream=data, filetype="pdf") as doc:
+                    return "\n".join(page.get_text("text") for page in doc).strip()
+            except Exception as e:
+                logger.warning(f"PyMuPDF could not read {file_path}, trying PyPDF2: {e}")
+        
+        import PyPDF2
+        
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in pdf_reader.pages).strip()
+    
+    def _extract_pdf_text_pdfium(self, pdfium, data: bytes) -> str:
+        """
+        Extract text from the raw bytes of a PDF file with pypdfium2.
+        
+        Args:
+            pdfium: The imported pypdfium2 module
+            data: PDF file content
+            
+        Returns:
+            Extracted text content
+        """
+        pdf = pdfium.PdfDocument(data)
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "\n".join(pages).strip()
+        finally:
+            pdf.close()
+    
     def read_word_file(self, file_path: str) -> str:
         """
         Extract text content from a Word document.
@@ -101,19 +308,71 @@ class FileUtils:
             Extracted text content
         """
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return self._extract_word_text(Path(file_path).read_bytes())
         except Exception as e:
             logger.error(f"Error reading Word file {file_path}: {e}")
             return ""
     
+    def _extract_word_text(self, data: bytes) -> str:
+        """
+        Extract text from the raw bytes of a Word document.
+        
+        Args:
+            data: Word document content
+            
+        Returns:
+            Extracted text content
+        """
+        if _import_etree() is not None:
+            try:
+                return self._stream_word_text(data)
+            except Exception as e:
+                logger.warning(f"Streaming DOCX parse failed, using python-docx: {e}")
+        
+        from docx import Document
+        
+        doc = Document(io.BytesIO(data))
+        
+        # Query the text nodes with lxml XPath instead of building python-docx
+        # Paragraph/Run objects; texts are joined per paragraph so that runs of
+        # one paragraph are not split onto separate lines
+        paragraphs = doc.element.body.xpath("./w:p")
+        return "\n".join("".join(paragraph.xpath(".//w:t/text()")) for paragraph in paragraphs).strip()
+    
+    def _stream_word_text(self, data: bytes) -> str:
+        """
+        Extract paragraph text from a DOCX file by streaming ``word/document.xml``.
+        
+        Each paragraph element is cleared as soon as its text is collected, so
+        memory use does not grow with the size of the document.
+        
+        Args:
+            data: Word document content
+            
+        Returns:
+            Extracted text content, one paragraph per line
+        """
+        paragraphs = []
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            with archive.open("word/document.xml") as document:
+                for _, element in _import_etree().iterparse(document, tag=_WORD_NS + "p"):
+                    paragraphs.append("".join(node.text or "" for node in element.iter(_WORD_NS + "t")))
+                    element.clear()
+                    
+                    # Drop already processed siblings still referenced by the parent
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        
+        return "\n".join(paragraphs).strip()
+    
     def read_file(self, file_path: str) -> str:
         """
         Read file content based on file extension.
         
+        Text extracted from PDF and Word files is cached on disk under
+        ``outputs/.parse_cache``, keyed by a hash of the file bytes, so an
+        unchanged document is only parsed once.
+        
         Args:
             file_path: Path to the file
             
@@ -130,14 +389,97 @@ class FileUtils:
         
         if extension == '.txt':
             return self.read_text_file(str(file_path))
-        elif extension == '.pdf':
-            return self.read_pdf_file(str(file_path))
-        elif extension in ['.docx', '.doc']:
-            return self.read_word_file(str(file_path))
+        elif extension in _CACHED_EXTENSIONS:
+            return self._read_document_cached(file_path, extension)
         else:
             logger.warning(f"Unsupported file extension: {extension}")
             return self.read_text_file(str(file_path))
     
+    def read_files(self, file_paths: List[str], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Read many files in parallel worker processes.
+        
+        PDF and Word parsing is CPU-bound, so files are spread over a process
+        pool; documents already in the parse cache are returned without parsing.
+        
+        Args:
+            file_paths: Paths of the files to read
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping each path to its content
+        """
+        if len(file_paths) <= 1:
+            return {path: self.read_file(path) for path in file_paths}
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        try:
+            # Spawn rather than fork: the caller may already run torch or Streamlit threads
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                contents = executor.map(partial(_read_one, str(self.base_path)), file_paths, chunksize=4)
+                return dict(zip(file_paths, contents))
+        except Exception as e:
+            logger.error(f"Parallel file reading failed, reading sequentially: {e}")
+            return {path: self.read_file(path) for path in file_paths}
+    
+    def _read_document_cached(self, file_path: Path, extension: str) -> str:
+        """
+        Read a PDF or Word document through the content-hash parse cache.
+        
+        Args:
+            file_path: Path to the document
+            extension: Lower-case file extension
+            
+        Returns:
+            Extracted text content
+        """
+        try:
+            data = file_path.read_bytes()
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            return ""
+        
+        digest = hashlib.blake2b(data, digest_size=16)
+        digest.update(f"{extension}:{_PARSER_VERSION}".encode("utf-8"))
+        cache_path = self.parse_cache_dir / f"{digest.hexdigest()}.txt"
+        
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+        
+        try:
+            if extension == '.pdf':
+                text = self._extract_pdf_text(data, str(file_path))
+            else:
+                text = self._extract_word_text(data)
+        except Exception as e:
+            logger.error(f"Error parsing file {file_path}: {e}")
+            return ""
+        
+        if text:
+            self._write_parse_cache(cache_path, text)
+        
+        return text
+    
+    def _write_parse_cache(self, cache_path: Path, text: str):
+        """Atomically store extracted text in the parse cache."""
+        try:
+            self.parse_cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.parse_cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    file.write(text)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write parse cache entry {cache_path}: {e}")
+    
     def save_json(self, data: Dict, file_path: str, indent: int = 2):
         """
         Save data to a JSON file.
@@ -151,26 +493,53 @@ class FileUtils:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=indent, ensure_ascii=False)
+            file_path.write_bytes(_dump_json_bytes(data, indent))
+            
+            logger.info(f"Saved JSON file: {file_path}")
+        except Exception as e:
+            logger.error(f"Error saving JSON file {file_path}: {e}")
+    
+    async def save_json_async(self, data: Dict, file_path: str, indent: int = 2):
+        """
+        Save data to a JSON file without blocking the event loop.
+        
+        Args:
+            data: Data to save
+            file_path: Output file path
+            indent: JSON indentation
+        """
+        try:
+            file_path = Path(file_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            await self._write_bytes_async(file_path, _dump_json_bytes(data, indent))
             
             logger.info(f"Saved JSON file: {file_path}")
         except Exception as e:
             logger.error(f"Error saving JSON file {file_path}: {e}")
     
-    def load_json(self, file_path: str) -> Dict:
+    def load_json(self, file_path: str, schema: Optional[str] = None) -> Dict:
         """
         Load data from a JSON file.
         
         Args:
             file_path: Path to the JSON file
+            schema: Name of a known schema to validate against
+                ("interview_questions" or "candidate_responses")
             
         Returns:
-            Loaded data dictionary
+            Loaded data dictionary (empty if loading or validation fails)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            raw = Path(file_path).read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            
+            if schema is not None:
+                validator = _get_json_validator(schema)
+                if validator is not None:
+                    validator(data)
+            
+            return data
         except Exception as e:
             logger.error(f"Error loading JSON file {file_path}: {e}")
             return {}
@@ -187,37 +556,70 @@ class FileUtils:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(content)
+            file_path.write_text(content, encoding='utf-8')
             
             logger.info(f"Saved Markdown file: {file_path}")
         except Exception as e:
             logger.error(f"Error saving Markdown file {file_path}: {e}")
     
-    def list_files(self, directory: str, extensions: Optional[List[str]] = None) -> List[str]:
+    async def save_markdown_async(self, content: str, file_path: str):
+        """
+        Save content to a Markdown file without blocking the event loop.
+        
+        Args:
+            content: Markdown content to save
+            file_path: Output file path
+        """
+        try:
+            file_path = Path(file_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            await self._write_bytes_async(file_path, content.encode('utf-8'))
+            
+            logger.info(f"Saved Markdown file: {file_path}")
+        except Exception as e:
+            logger.error(f"Error saving Markdown file {file_path}: {e}")
+    
+    async def _write_bytes_async(self, file_path: Path, data: bytes):
+        """Write bytes with aiofiles, or in the default executor when it is not installed."""
+        aiofiles = _import_aiofiles()
+        if aiofiles is not None:
+            async with aiofiles.open(file_path, 'wb') as file:
+                await file.write(data)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, file_path.write_bytes, data)
+    
+    def list_files(self, directory: str, extensions: Optional[Iterable[str]] = None) -> List[str]:
         """
         List files in a directory with optional extension filtering.
         
         Args:
             directory: Directory to search
-            extensions: List of file extensions to include (e.g., ['.pdf', '.txt'])
+            extensions: File extensions to include (e.g., ['.pdf', '.txt']); a frozenset of
+                lower-case extensions is used as-is
             
         Returns:
             List of file paths
         """
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            if not os.path.isdir(directory):
                 logger.warning(f"Directory not found: {directory}")
                 return []
             
-            files = []
-            for file_path in dir_path.iterdir():
-                if file_path.is_file():
-                    if extensions is None or file_path.suffix.lower() in extensions:
-                        files.append(str(file_path))
+            if extensions is None or isinstance(extensions, frozenset):
+                exts = extensions
+            else:
+                exts = frozenset(ext.lower() for ext in extensions)
+            
+            # DirEntry.is_file() reuses the type from the directory listing (no extra stat)
+            with os.scandir(directory) as entries:
+                files = [
+                    entry.path for entry in entries
+                    if entry.is_file() and (exts is None or os.path.splitext(entry.name)[1].lower() in exts)
+                ]
             
-            return sorted(files)
+            files.sort()
+            return files
         except Exception as e:
             logger.error(f"Error listing files in {directory}: {e}")
             return []
@@ -230,7 +632,7 @@ class FileUtils:
             List of CV file paths
         """
         cv_dir = self.base_path / "data" / "cv_samples"
-        return self.list_files(str(cv_dir), ['.pdf', '.docx', '.txt'])
+        return self.list_files(str(cv_dir), self._CV_EXTS)
     
     def get_job_descriptions(self) -> List[str]:
         """
@@ -240,7 +642,7 @@ class FileUtils:
             List of job description file paths
         """
         jd_dir = self.base_path / "data" / "job_descriptions"
-        return self.list_files(str(jd_dir), ['.pdf', '.docx', '.txt'])
+        return self.list_files(str(jd_dir), self._CV_EXTS)
     
     def create_sample_data(self):
         """
@@ -251,6 +653,29 @@ class FileUtils:
         self._create_sample_interview_questions()
         self._create_sample_responses()
     
+    def _write_many(self, files: Dict[Path, Union[str, bytes]]):
+        """
+        Write several small files with raw OS calls.
+        
+        Each file is written with one ``os.open``/``os.write``/``os.close``
+        sequence, skipping the buffered text-file machinery of ``open()``.
+        
+        Args:
+            files: Mapping of file paths to their text or binary content
+        """
+        for file_path, content in files.items():
+            data = content.encode('utf-8') if isinstance(content, str) else content
+            try:
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            except Exception as e:
+                logger.error(f"Error writing file {file_path}: {e}")
+    
     def _create_sample_cvs(self):
         """Create sample CV files."""
         cv_samples = {
@@ -315,10 +740,7 @@ Bachelor of Science in Computer Science | State University | 2022
         }
         
         cv_dir = self.base_path / "data" / "cv_samples"
-        for filename, content in cv_samples.items():
-            file_path = cv_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(content.strip())
+        self._write_many({cv_dir / filename: content.strip() for filename, content in cv_samples.items()})
         
         logger.info("Created sample CV files")
     
@@ -384,10 +806,7 @@ NICE TO HAVE:
         }
         
         jd_dir = self.base_path / "data" / "job_descriptions"
-        for filename, content in job_descriptions.items():
-            file_path = jd_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(content.strip())
+        self._write_many({jd_dir / filename: content.strip() for filename, content in job_descriptions.items()})
         
         logger.info("Created sample job description files")
     
@@ -435,9 +854,10 @@ NICE TO HAVE:
         }
         
         questions_dir = self.base_path / "data" / "interview_questions"
-        for filename, content in questions.items():
-            file_path = questions_dir / filename
-            self.save_json(content, str(file_path))
+        self._write_many({
+            questions_dir / filename: _dump_json_bytes(content)
+            for filename, content in questions.items()
+        })
         
         logger.info("Created sample interview questions")
     
@@ -463,8 +883,9 @@ NICE TO HAVE:
         }
         
         responses_dir = self.base_path / "data" / "sample_responses"
-        for filename, content in responses.items():
-            file_path = responses_dir / filename
-            self.save_json(content, str(file_path))
+        self._write_many({
+            responses_dir / filename: _dump_json_bytes(content)
+            for filename, content in responses.items()
+        })
         
         logger.info("Created sample candidate responses")
@@ -0,0 +1,108 @@
+"""
+LLM Result Cache for Candidate Evaluation System
+
+This module provides a small disk cache for complete results of LLM-backed steps
+(such as generated reports). Entries are keyed on the model name and the exact
+inputs, so repeating a step on identical inputs is a file read instead of a model
+call.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+from loguru import logger
+
+
+class LLMCache:
+    """
+    Disk cache mapping (model, inputs) to results of LLM-backed steps.
+    
+    Each entry is a small JSON file named after its key, written through a
+    temporary file and an atomic rename, so storing a result never rewrites
+    other entries.
+    """
+    
+    def __init__(self, directory: str = "data/llm_cache"):
+        """
+        Initialize the cache directory.
+        
+        Args:
+            directory: Directory holding the cache entries
+        """
+        self.directory = Path(directory)
+    
+    @staticmethod
+    def cache_key(model: str, **inputs) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            model: Name of the model producing the result
+            **inputs: Inputs of the request (JSON-serializable)
+            
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        payload = json.dumps({"model": model, "inputs": inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def is_cacheable(model_config: Dict) -> bool:
+        """
+        Check whether results generated with a model configuration are reproducible.
+        
+        Args:
+            model_config: The ``model`` section of the configuration
+            
+        Returns:
+            True for greedy decoding or a temperature of zero
+        """
+        return not model_config.get('do_sample', False) or model_config.get('temperature', 0) == 0
+    
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Cache key from ``cache_key``
+            
+        Returns:
+            Cached result, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path}: {e}")
+            return None
+    
+    def set(self, key: str, result: Dict):
+        """
+        Store a result in its own cache file.
+        
+        Args:
+            key: Cache key from ``cache_key``
+            result: Result to store
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump(result, file, ensure_ascii=False, default=str)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write LLM cache entry {key}: {e}")
@@ -5,37 +5,18 @@ This module contains carefully crafted prompts for different evaluation tasks
 including CV analysis, interview scoring, and report generation.
 """
 
-from typing import Dict, List, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional, Tuple
 
 
-class PromptTemplates:
-    """
-    Collection of prompt templates for the candidate evaluation system.
-    
-    Each template is designed to work with instruction-tuned models like Mistral
-    and provides structured output formats for consistent evaluation results.
-    """
-    
-    @staticmethod
-    def cv_analysis_prompt(cv_text: str, job_description: str) -> str:
-        """
-        Generate a prompt for CV analysis against job description.
-        
-        Args:
-            cv_text: Text content of the CV
-            job_description: Job description text
-            
-        Returns:
-            Formatted prompt for CV analysis
-        """
-        # Truncate inputs to avoid token limits
-        cv_short = cv_text[:500] + "..." if len(cv_text) > 500 else cv_text
-        job_short = job_description[:500] + "..." if len(job_description) > 500 else job_description
-        
-        return f"""Analyze CV vs Job Description. Return ONLY valid JSON:
-
-CV: {cv_short}
-Job: {job_short}
+# Prompt skeletons formatted per call; literal JSON braces are doubled. Every template
+# starts with its static instructions and output format and ends with the per-call
+# data, so calls share a byte-identical prefix that prefix-caching backends (vLLM's
+# enable_prefix_caching) compute once. Job descriptions precede CVs for the same reason.
+_CV_ANALYSIS_TPL = """Analyze CV vs Job Description. Return ONLY valid JSON in this format:
 
 {{
     "overall_score": 75,
@@ -50,34 +31,48 @@ Job: {job_short}
     }},
     "recommendations": ["Consider additional training", "Schedule technical interview"],
     "confidence": 80
-}}"""
+}}
 
-    @staticmethod
-    def interview_scoring_prompt(question: str, response: str, criteria: List[str]) -> str:
-        """
-        Generate a prompt for scoring interview responses.
-        
-        Args:
-            question: Interview question asked
-            response: Candidate's response
-            criteria: List of evaluation criteria
-            
-        Returns:
-            Formatted prompt for interview scoring
-        """
-        criteria_str = ", ".join(criteria)
-        
-        return f"""You are an expert interviewer evaluating a candidate's response to an interview question.
-Please assess the following response based on the specified criteria.
+Job: {job}
+CV: {cv}"""
 
-INTERVIEW QUESTION:
-{question}
+_SKILL_EXTRACTION_TPL = """Extract skills from CV. Return ONLY valid JSON in this format:
 
-CANDIDATE RESPONSE:
-{response}
+{{
+    "technical_skills": {{
+        "programming_languages": ["python", "javascript"],
+        "frameworks": ["django", "react"],
+        "tools": ["git", "docker"]
+    }},
+    "soft_skills": ["communication", "teamwork"],
+    "experience_level": "senior",
+    "years_experience": "5-7 years"
+}}
 
-EVALUATION CRITERIA:
-{criteria_str}
+CV: {cv}"""
+
+_JOB_REQUIREMENT_EXTRACTION_TPL = """Extract job requirements. Return ONLY valid JSON in this format:
+
+{{
+    "required_skills": {{
+        "technical_skills": ["python", "javascript"],
+        "soft_skills": ["communication", "teamwork"],
+        "tools": ["git"]
+    }},
+    "experience_requirements": {{
+        "years_experience": "1-3 years",
+        "experience_level": "junior"
+    }},
+    "education_requirements": {{
+        "degree_level": "bachelor"
+    }}
+}}
+
+Job: {job}"""
+
+
+_INTERVIEW_SCORING_TPL = """You are an expert interviewer evaluating a candidate's response to an interview question.
+Please assess the response given at the end based on the specified criteria.
 
 Please provide your scoring in the following JSON format:
 {{
@@ -120,28 +115,19 @@ Evaluation Guidelines:
 4. Cultural Fit: Evaluate alignment with company values and team dynamics
 5. Confidence: Assess self-assurance and professional presence
 
-Be fair and objective in your assessment."""
+Be fair and objective in your assessment.
 
-    @staticmethod
-    def question_generation_prompt(job_description: str, cv_analysis: Dict) -> str:
-        """
-        Generate a prompt for creating personalized interview questions.
-        
-        Args:
-            job_description: Job description text
-            cv_analysis: Results from CV analysis
-            
-        Returns:
-            Formatted prompt for question generation
-        """
-        return f"""You are an expert interviewer creating personalized interview questions for a candidate.
-Based on the job description and CV analysis, generate relevant interview questions.
+EVALUATION CRITERIA:
+{criteria_str}
 
-JOB DESCRIPTION:
-{job_description}
+INTERVIEW QUESTION:
+{question}
 
-CV ANALYSIS:
-{cv_analysis}
+CANDIDATE RESPONSE:
+{response}"""
+
+_QUESTION_GENERATION_TPL = """You are an expert interviewer creating personalized interview questions for a candidate.
+Based on the job description and CV analysis given at the end, generate relevant interview questions.
 
 Please generate interview questions in the following JSON format:
 {{
@@ -191,32 +177,16 @@ Focus on:
 4. Evaluating problem-solving abilities
 5. Testing technical knowledge appropriate to the role
 
-Generate 2-3 questions per category that are specific to this candidate's background and the job requirements."""
+Generate 2-3 questions per category that are specific to this candidate's background and the job requirements.
 
-    @staticmethod
-    def report_generation_prompt(cv_analysis: Dict, interview_scores: Dict, candidate_info: Dict) -> str:
-        """
-        Generate a prompt for creating comprehensive evaluation reports.
-        
-        Args:
-            cv_analysis: Results from CV analysis
-            interview_scores: Results from interview scoring
-            candidate_info: Basic candidate information
-            
-        Returns:
-            Formatted prompt for report generation
-        """
-        return f"""You are an expert HR professional creating a comprehensive candidate evaluation report.
-Please generate a professional report based on the CV analysis and interview scores.
-
-CANDIDATE INFORMATION:
-{candidate_info}
+JOB DESCRIPTION:
+{job_description}
 
-CV ANALYSIS RESULTS:
-{cv_analysis}
+CV ANALYSIS:
+{cv_analysis}"""
 
-INTERVIEW SCORING RESULTS:
-{interview_scores}
+_REPORT_TPL = """You are an expert HR professional creating a comprehensive candidate evaluation report.
+Please generate a professional report based on the CV analysis and interview scores given at the end.
 
 Please create a comprehensive evaluation report in Markdown format with the following structure:
 
@@ -271,37 +241,243 @@ Please create a comprehensive evaluation report in Markdown format with the foll
 - Red flags to monitor
 
 Format the report professionally with clear sections, bullet points, and actionable insights. 
-Be objective and provide evidence-based recommendations."""
+Be objective and provide evidence-based recommendations.
+
+CANDIDATE INFORMATION:
+{candidate_info}
+
+CV ANALYSIS RESULTS:
+{cv_analysis}
+
+INTERVIEW SCORING RESULTS:
+{interview_scores}"""
+
+# Per-input token budget when the tokenizer does not report its context size
+_DEFAULT_INPUT_TOKENS = 256
+
+# Rough characters-per-token ratio used when no tokenizer has been set
+_CHARS_PER_TOKEN = 4
+
+# Number of rendered prompts kept per memoized prompt builder
+_PROMPT_CACHE_SIZE = 128
+
 
+@lru_cache(maxsize=4)
+def _load_tokenizer(model_name: str):
+    """Load (once per model name) the tokenizer used for prompt truncation."""
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(model_name, use_fast=True)
+
+
+def _truncate(text: str) -> str:
+    """
+    Truncate text to the prompt input token budget, marking the cut with an ellipsis.
+    
+    Uses the tokenizer set with ``PromptTemplates.set_tokenizer``; without one,
+    the budget is approximated in characters and the text is cut at a word
+    boundary.
+    """
+    tokenizer = PromptTemplates._tokenizer
+    max_tokens = PromptTemplates._max_input_tokens
+    
+    if tokenizer is None:
+        limit = max_tokens * _CHARS_PER_TOKEN
+        if len(text) <= limit:
+            return text
+        cut = text.rfind(" ", 0, limit)
+        return text[:cut if cut > 0 else limit] + "..."
+    
+    token_ids = tokenizer.encode(text, add_special_tokens=False)
+    if len(token_ids) <= max_tokens:
+        return text
+    return tokenizer.decode(token_ids[:max_tokens], skip_special_tokens=True) + "..."
+
+
+def _memoize_by_digest(builder: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize a prompt builder on a BLAKE2 digest of its inputs.
+    
+    Unlike ``lru_cache``, the cache does not keep the (possibly long) input texts
+    alive as keys; each entry holds a 16-byte digest and the rendered prompt.
+    Arguments are strings or tuples of strings.
+    """
+    cache: "OrderedDict[bytes, str]" = OrderedDict()
+    lock = threading.Lock()
+    
+    @wraps(builder)
+    def memoized(*args) -> str:
+        # Length-prefix every string so that different arguments never hash alike
+        digest = hashlib.blake2b(digest_size=16)
+        for arg in args:
+            items = arg if isinstance(arg, tuple) else (arg,)
+            digest.update(len(items).to_bytes(4, "little"))
+            for item in items:
+                data = item.encode("utf-8")
+                digest.update(len(data).to_bytes(8, "little"))
+                digest.update(data)
+        key = digest.digest()
+        
+        with lock:
+            prompt = cache.get(key)
+            if prompt is not None:
+                cache.move_to_end(key)
+                return prompt
+        
+        prompt = builder(*args)
+        with lock:
+            cache[key] = prompt
+            while len(cache) > _PROMPT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return prompt
+    
+    def cache_clear():
+        with lock:
+            cache.clear()
+    
+    memoized.cache_clear = cache_clear
+    return memoized
+
+
+# Prompt builders are memoized: the same CV/job pair is prompted for again across
+# pipeline stages and re-scoring runs. Truncation depends on the tokenizer, so
+# PromptTemplates.set_tokenizer clears these caches.
+@_memoize_by_digest
+def _cv_analysis_prompt(cv_text: str, job_description: str) -> str:
+    return _CV_ANALYSIS_TPL.format(cv=_truncate(cv_text), job=_truncate(job_description))
+
+
+@_memoize_by_digest
+def _skill_extraction_prompt(cv_text: str) -> str:
+    return _SKILL_EXTRACTION_TPL.format(cv=_truncate(cv_text))
+
+
+@_memoize_by_digest
+def _job_requirement_extraction_prompt(job_description: str) -> str:
+    return _JOB_REQUIREMENT_EXTRACTION_TPL.format(job=_truncate(job_description))
+
+
+class PromptTemplates:
+    """
+    Collection of prompt templates for the candidate evaluation system.
+    
+    Each template is designed to work with instruction-tuned models like Mistral
+    and provides structured output formats for consistent evaluation results.
+    
+    CV and job description inputs are truncated to a token budget, measured
+    with the tokenizer set through ``set_tokenizer``.
+    """
+    
+    _tokenizer = None
+    _max_input_tokens = _DEFAULT_INPUT_TOKENS
+    
+    @classmethod
+    def set_tokenizer(cls, tokenizer, max_input_tokens: Optional[int] = None):
+        """
+        Set the tokenizer used to truncate prompt inputs.
+        
+        Args:
+            tokenizer: Tokenizer instance, or a model name to load it from
+            max_input_tokens: Token budget per input (defaults to a quarter of the
+                model context, leaving room for the other input, the template
+                and the generated output)
+        """
+        if isinstance(tokenizer, str):
+            tokenizer = _load_tokenizer(tokenizer)
+        
+        if max_input_tokens is None:
+            model_max_length = getattr(tokenizer, "model_max_length", None)
+            # Tokenizers without a known context report a huge sentinel value
+            if isinstance(model_max_length, int) and 0 < model_max_length < 1_000_000:
+                max_input_tokens = model_max_length // 4
+            else:
+                max_input_tokens = _DEFAULT_INPUT_TOKENS
+        
+        cls._tokenizer = tokenizer
+        cls._max_input_tokens = max_input_tokens
+        
+        for builder in (_cv_analysis_prompt, _skill_extraction_prompt, _job_requirement_extraction_prompt):
+            builder.cache_clear()
+    
     @staticmethod
-    def skill_extraction_prompt(cv_text: str) -> str:
+    def cv_analysis_prompt(cv_text: str, job_description: str) -> str:
         """
-        Generate a prompt for extracting skills from CV text.
+        Generate a prompt for CV analysis against job description.
         
         Args:
             cv_text: Text content of the CV
+            job_description: Job description text
             
         Returns:
-            Formatted prompt for skill extraction
+            Formatted prompt for CV analysis
+        """
+        return _cv_analysis_prompt(cv_text, job_description)
+
+    @staticmethod
+    def interview_scoring_prompt(question: str, response: str, criteria: List[str]) -> str:
+        """
+        Generate a prompt for scoring interview responses.
+        
+        Args:
+            question: Interview question asked
+            response: Candidate's response
+            criteria: List of evaluation criteria
+            
+        Returns:
+            Formatted prompt for interview scoring
         """
+        return PromptTemplates._interview_scoring_prompt(question, response, tuple(criteria))
+    
+    @staticmethod
+    @_memoize_by_digest
+    def _interview_scoring_prompt(question: str, response: str, criteria: Tuple[str, ...]) -> str:
+        """Build the interview scoring prompt (memoized; criteria are passed as a tuple)."""
+        return _INTERVIEW_SCORING_TPL.format(
+            question=question, response=response, criteria_str=", ".join(criteria)
+        )
 
-        # Truncate input to avoid token limits
-        cv_short = cv_text[:500] + "..." if len(cv_text) > 500 else cv_text
+    @staticmethod
+    def question_generation_prompt(job_description: str, cv_analysis: Dict) -> str:
+        """
+        Generate a prompt for creating personalized interview questions.
         
-        return f"""Extract skills from CV. Return ONLY valid JSON:
+        Args:
+            job_description: Job description text
+            cv_analysis: Results from CV analysis
+            
+        Returns:
+            Formatted prompt for question generation
+        """
+        return _QUESTION_GENERATION_TPL.format(job_description=job_description, cv_analysis=cv_analysis)
 
-CV: {cv_short}
+    @staticmethod
+    def report_generation_prompt(cv_analysis: Dict, interview_scores: Dict, candidate_info: Dict) -> str:
+        """
+        Generate a prompt for creating comprehensive evaluation reports.
+        
+        Args:
+            cv_analysis: Results from CV analysis
+            interview_scores: Results from interview scoring
+            candidate_info: Basic candidate information
+            
+        Returns:
+            Formatted prompt for report generation
+        """
+        return _REPORT_TPL.format(
+            candidate_info=candidate_info, cv_analysis=cv_analysis, interview_scores=interview_scores
+        )
 
-{{
-    "technical_skills": {{
-        "programming_languages": ["python", "javascript"],
-        "frameworks": ["django", "react"],
-        "tools": ["git", "docker"]
-    }},
-    "soft_skills": ["communication", "teamwork"],
-    "experience_level": "senior",
-    "years_experience": "5-7 years"
-}}"""
+    @staticmethod
+    def skill_extraction_prompt(cv_text: str) -> str:
+        """
+        Generate a prompt for extracting skills from CV text.
+        
+        Args:
+            cv_text: Text content of the CV
+            
+        Returns:
+            Formatted prompt for skill extraction
+        """
+        return _skill_extraction_prompt(cv_text)
 
     @staticmethod
     def job_requirement_extraction_prompt(job_description: str) -> str:
@@ -314,24 +490,4 @@ CV: {cv_short}
         Returns:
             Formatted prompt for requirement extraction
         """
-        # Truncate input to avoid token limits
-        job_short = job_description[:500] + "..." if len(job_description) > 500 else job_description
-        
-        return f"""Extract job requirements. Return ONLY valid JSON:
-
-Job: {job_short}
-
-{{
-    "required_skills": {{
-        "technical_skills": ["python", "javascript"],
-        "soft_skills": ["communication", "teamwork"],
-        "tools": ["git"]
-    }},
-    "experience_requirements": {{
-        "years_experience": "1-3 years",
-        "experience_level": "junior"
-    }},
-    "education_requirements": {{
-        "degree_level": "bachelor"
-    }}
-}}"""
+        return _job_requirement_extraction_prompt(job_description)
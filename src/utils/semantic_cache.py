@@ -0,0 +1,191 @@
+"""
+Semantic Cache for Candidate Evaluation System
+
+This module provides a near-duplicate cache for CV analysis results. A cached
+analysis is only reused for the exact same job description (matched by hash); the
+CV is embedded on its own with a sentence-transformers model and matched by cosine
+similarity, so a re-exported or lightly reworded CV reuses an earlier analysis. A
+lexical guard on the extracted CV skills rejects semantically close CVs whose skill
+sets actually differ.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+import numpy as np
+from loguru import logger
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    """Return the Jaccard overlap of two sets (1.0 when both are empty)."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class SemanticCache:
+    """
+    Cache mapping (job description text, CV embedding) to analysis results.
+    
+    Entries are grouped by a SHA-256 hash of the job description, so a changed
+    requirement never matches an analysis made against the old text. Within a group
+    CV embeddings are L2-normalized and compared by inner product. Entries are
+    appended to ``entries.jsonl`` under ``directory``, one JSON line per insert.
+    """
+    
+    def __init__(self, directory: str = "data/semantic_cache",
+                 model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 threshold: float = 0.92, min_skill_overlap: float = 0.8):
+        """
+        Initialize the cache and load persisted entries.
+        
+        Args:
+            directory: Directory holding the cache entries
+            model_name: Sentence-transformers model used for CV embeddings
+            threshold: Minimum cosine similarity of the CVs for a hit
+            min_skill_overlap: Minimum Jaccard overlap of the CV skill sets for a hit
+        """
+        self.directory = Path(directory)
+        self.entries_path = self.directory / "entries.jsonl"
+        self.model_name = model_name
+        self.threshold = threshold
+        self.min_skill_overlap = min_skill_overlap
+        
+        self._lock = threading.Lock()
+        self._encoder = None
+        # Job description hash -> (CV embeddings, entries), in insertion order
+        self._groups: Dict[str, Dict[str, List]] = {}
+        self._load()
+    
+    @staticmethod
+    def job_key(job_description: str) -> str:
+        """Return the SHA-256 hex digest identifying a job description."""
+        return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+    
+    def _get_encoder(self):
+        """Load the sentence-transformers model on first use."""
+        if self._encoder is None:
+            from sentence_transformers import SentenceTransformer
+            logger.info(f"Loading semantic cache embedding model: {self.model_name}")
+            self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder
+    
+    def embed(self, cv_text: str) -> np.ndarray:
+        """
+        Embed a CV.
+        
+        The encoder truncates long inputs (256 tokens for all-MiniLM-L6-v2), so the
+        embedding covers the start of the CV; the skill guard covers the rest.
+        
+        Args:
+            cv_text: CV content
+            
+        Returns:
+            Normalized float32 embedding vector
+        """
+        vector = self._get_encoder().encode(cv_text, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+    
+    def lookup(self, job_description: str, embedding: np.ndarray, skills: Set[str]) -> Optional[Dict]:
+        """
+        Find the cached result of the most similar CV analyzed against the same job description.
+        
+        Args:
+            job_description: Job description content (must match exactly)
+            embedding: CV embedding from ``embed``
+            skills: Skill tokens extracted from the CV
+            
+        Returns:
+            Deep copy of the cached result, or None if no entry for the job
+            description passes both the similarity threshold and the skill
+            overlap guard
+        """
+        with self._lock:
+            group = self._groups.get(self.job_key(job_description))
+            if group is None:
+                return None
+            
+            similarities = np.asarray(group["embeddings"]) @ embedding
+            best = int(np.argmax(similarities))
+            score = float(similarities[best])
+            
+            if score < self.threshold:
+                return None
+            
+            entry = group["entries"][best]
+            overlap = _jaccard(skills, set(entry["skills"]))
+            if overlap < self.min_skill_overlap:
+                logger.debug(f"Semantic cache candidate rejected (similarity {score:.3f}, skill overlap {overlap:.2f})")
+                return None
+            
+            logger.info(f"Semantic cache hit (similarity {score:.3f}, skill overlap {overlap:.2f})")
+            return copy.deepcopy(entry["result"])
+    
+    def add(self, job_description: str, embedding: np.ndarray, skills: Set[str], result: Dict):
+        """
+        Store a result and append it to the cache file.
+        
+        Args:
+            job_description: Job description content
+            embedding: CV embedding from ``embed``
+            skills: Skill tokens extracted from the CV
+            result: Analysis result to store (copied, later changes do not affect the cache)
+        """
+        record = {
+            "job": self.job_key(job_description),
+            "embedding": np.asarray(embedding, dtype=np.float32).tolist(),
+            "skills": sorted(skills),
+            "result": result
+        }
+        
+        with self._lock:
+            try:
+                line = json.dumps(record, ensure_ascii=False)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Not caching unserializable analysis result: {e}")
+                return
+            
+            self._insert(record)
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with open(self.entries_path, 'a', encoding='utf-8') as file:
+                    file.write(line + "\n")
+            except Exception as e:
+                logger.warning(f"Failed to write semantic cache {self.entries_path}: {e}")
+    
+    def _insert(self, record: Dict):
+        """Add a record to the in-memory groups, isolated from the caller's objects."""
+        group = self._groups.setdefault(record["job"], {"embeddings": [], "entries": []})
+        group["embeddings"].append(np.asarray(record["embedding"], dtype=np.float32))
+        group["entries"].append({"skills": list(record["skills"]), "result": copy.deepcopy(record["result"])})
+    
+    def _load(self):
+        """Load persisted entries (skipping a torn or unreadable line)."""
+        if not self.entries_path.exists():
+            return
+        
+        loaded = 0
+        line = "\n"
+        try:
+            with open(self.entries_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping unreadable semantic cache line in {self.entries_path}")
+                        continue
+                    self._insert(record)
+                    loaded += 1
+            
+            # Terminate a torn last line so that the next append starts a fresh one
+            if not line.endswith("\n"):
+                with open(self.entries_path, 'a', encoding='utf-8') as file:
+                    file.write("\n")
+            
+            logger.info(f"Loaded {loaded} semantic cache entries")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.directory}: {e}")
+            self._groups = {}
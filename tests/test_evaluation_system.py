@@ -97,6 +97,14 @@ class TestCVAnalyzer:
         
         assert python_found, "Python should be extracted from the sample CV"
     
+    def test_fallback_skill_extraction_matches_whole_tokens(self, cv_analyzer):
+        """Test that skills match as whole tokens and aliases are normalized."""
+        skills = cv_analyzer._fallback_skill_extraction("Good with JavaScript, Golang, K8s and C++")
+        technical = skills["technical_skills"]
+        
+        assert technical["programming_languages"] == ["Javascript", "C++", "Go"]
+        assert technical["tools"] == ["Kubernetes"]
+    
     def test_fallback_requirement_extraction(self, cv_analyzer, sample_job_description):
         """Test fallback requirement extraction functionality."""
         requirements = cv_analyzer._fallback_requirement_extraction(sample_job_description)
@@ -291,6 +299,18 @@ class TestCVAnalyzer:
         assert "candidate2" in summary
         assert "80.0/100" in summary
         assert "60.0/100" in summary
+    
+    def test_generate_analysis_summary_ranks_by_score(self, cv_analyzer):
+        """Test that the summary lists the highest-scoring candidates first."""
+        test_results = {
+            "low": {"overall_assessment": {"overall_score": 40}},
+            "failed": {"error": "Failed to read input files"},
+            "high": {"overall_assessment": {"overall_score": 90}}
+        }
+        
+        summary = cv_analyzer.generate_analysis_summary(test_results)
+        
+        assert summary.index("## high") < summary.index("## low") < summary.index("## failed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,179 @@
+"""
+Unit tests for the model layer.
+
+This module contains tests for JSON extraction from model output and the
+on-disk LLM response cache.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.models import _response_cache
+from src.models._response_cache import CachePolicy, ResponseCache
+from src.models.llm_client import LLMClient
+
+
+class TestFindJsonObject:
+    """Test cases for JSON object extraction from model responses."""
+    
+    def test_returns_first_balanced_object(self):
+        """Test that nested objects are returned whole and trailing text is ignored."""
+        text = 'Here is the result: {"a": {"b": [1, 2]}, "c": 3} and a stray } brace'
+        assert LLMClient._find_json_object(text) == '{"a": {"b": [1, 2]}, "c": 3}'
+    
+    def test_ignores_braces_inside_strings(self):
+        """Test that braces and escaped quotes inside strings do not end the object."""
+        text = 'prefix {"text": "a } b \\" { c", "n": 1} suffix'
+        found = LLMClient._find_json_object(text)
+        
+        assert found == '{"text": "a } b \\" { c", "n": 1}'
+        assert json.loads(found) == {"text": 'a } b " { c', "n": 1}
+    
+    def test_returns_none_without_balanced_object(self):
+        """Test that missing or unterminated objects are reported as None."""
+        assert LLMClient._find_json_object("no json here") is None
+        assert LLMClient._find_json_object('{"a": {"b": 1}') is None
+
+
+class TestResponseCache:
+    """Test cases for the LLM response cache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a response cache in a temporary directory."""
+        return ResponseCache(str(tmp_path / "llm"), CachePolicy(expiry="1H"))
+    
+    @staticmethod
+    def make_key(prompt="Score this response", **overrides):
+        """Build a cache key with default sampling parameters."""
+        params = {
+            "model_name": "test-model",
+            "temperature": 0.0,
+            "top_p": 0.9,
+            "do_sample": False,
+            "max_new_tokens": 256,
+            "repetition_penalty": 1.1
+        }
+        params.update(overrides)
+        return ResponseCache.make_key(prompt=prompt, **params)
+    
+    def test_make_key_is_stable(self):
+        """Test that identical requests map to the same key."""
+        assert self.make_key() == self.make_key()
+    
+    def test_make_key_hashes_prompt_parts_as_concatenated(self):
+        """Test that a prompt given as parts has the key of the joined prompt."""
+        assert self.make_key(("Score this ", "response")) == self.make_key("Score this response")
+    
+    @pytest.mark.parametrize("overrides", [
+        {"model_name": "other-model"},
+        {"temperature": 0.7},
+        {"top_p": 0.5},
+        {"do_sample": True},
+        {"max_new_tokens": 512},
+        {"repetition_penalty": 1.0},
+        {"prompt": "Score another response"}
+    ])
+    def test_make_key_depends_on_every_parameter(self, overrides):
+        """Test that changing any generation parameter changes the key."""
+        assert self.make_key(**overrides) != self.make_key()
+    
+    def test_set_and_get(self, cache):
+        """Test that a stored response is returned and other keys miss."""
+        key = self.make_key()
+        cache.set(key, "Score this response", "8/10")
+        
+        assert cache.get(key) == "8/10"
+        assert cache.get(self.make_key(max_new_tokens=512)) is None
+    
+    def test_set_leaves_only_the_entry_file(self, cache):
+        """Test that the temporary file is renamed into place."""
+        key = self.make_key()
+        cache.set(key, "Score this response", "8/10")
+        
+        assert [path.name for path in cache.directory.iterdir()] == [f"{key}.json"]
+    
+    def test_failed_write_leaves_no_entry(self, cache, monkeypatch):
+        """Test that an interrupted write neither creates an entry nor leaves temporary files."""
+        def failing_dump(obj, file, **kwargs):
+            file.write('{"prompt": "Score')
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(_response_cache.json, "dump", failing_dump)
+        key = self.make_key()
+        cache.set(key, "Score this response", "8/10")
+        
+        assert cache.get(key) is None
+        assert list(cache.directory.iterdir()) == []
+    
+    def test_expired_entries_are_ignored(self, cache):
+        """Test that entries older than the policy's expiry miss."""
+        key = self.make_key()
+        cache.set(key, "Score this response", "8/10")
+        
+        old = time.time() - 2 * 60 * 60
+        os.utime(cache.directory / f"{key}.json", (old, old))
+        
+        assert cache.get(key) is None
+    
+    def test_cache_policy_expiry(self):
+        """Test expiry parsing of the cache policy."""
+        assert CachePolicy(expiry="30M").max_age_seconds == 30 * 60
+        assert CachePolicy(expiry=None).max_age_seconds is None
+        
+        with pytest.raises(ValueError):
+            CachePolicy(expiry="1Y").max_age_seconds
+
+
+class TestBucketedGeneration:
+    """Test cases for batched generation with output length hints."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create a client without a model whose batched generation is recorded."""
+        client = LLMClient.__new__(LLMClient)
+        client.config = {
+            'model': {'name': 'test-model', 'temperature': 0.0, 'top_p': 0.9,
+                      'do_sample': False, 'max_new_tokens': 256},
+            'hardware': {'batch_size': 8}
+        }
+        client.engine = None
+        client.tokenizer = lambda prompts, **kwargs: {"input_ids": [prompt.split() for prompt in prompts]}
+        client.response_cache = ResponseCache(str(tmp_path / "llm"))
+        client.calls = []
+        
+        def fake_generate_batch(prompts, max_new_tokens=None):
+            client.calls.append((list(prompts), max_new_tokens))
+            return [f"{prompt}:{max_new_tokens}" for prompt in prompts]
+        
+        client._generate_batch = fake_generate_batch
+        return client
+    
+    def test_bins_never_mix_hints(self, client):
+        """Test that every prompt is generated with exactly its own hint."""
+        responses = client.generate_responses(["a", "b", "c"], output_length_hint=[64, 128, 64])
+        
+        assert responses == ["a:64", "b:128", "c:64"]
+        assert sorted(limit for _, limit in client.calls) == [64, 128]
+    
+    def test_hinted_prompts_hit_the_cache(self, client):
+        """Test that repeating a hinted request is served without generating."""
+        client.generate_responses(["a", "b", "c"], output_length_hint=[64, 128, 64])
+        client.calls.clear()
+        
+        responses = client.generate_responses(["b", "c"], output_length_hint=[128, 64])
+        
+        assert responses == ["b:128", "c:64"]
+        assert client.calls == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
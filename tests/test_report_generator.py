@@ -0,0 +1,96 @@
+"""
+Unit tests for Report Generator module.
+
+This module contains tests for saving batches of generated reports.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.evaluation.report_generator import ReportGenerator
+from src.utils.file_utils import FileUtils
+
+
+class TestSaveReportsBatch:
+    """Test cases for batch report saving."""
+    
+    @pytest.fixture
+    def report_generator(self):
+        """Create a report generator instance for testing (the model is not loaded)."""
+        return ReportGenerator()
+    
+    @pytest.fixture
+    def reports(self):
+        """Sample reports, including numpy values from the scoring code."""
+        return {
+            "alice": {
+                "overall_score": np.float64(82.5),
+                "skill_scores": {"python": np.int64(9)},
+                "summary_report": "# Alice\nStrong candidate"
+            },
+            "bob/smith": {
+                "overall_score": 61.0,
+                "summary_report": "# Bob\nNeeds mentoring"
+            }
+        }
+    
+    def test_json_reports_are_saved(self, report_generator, reports, tmp_path):
+        """Test that every report is written as valid JSON under a safe file name."""
+        saved = report_generator.save_reports_batch(reports, str(tmp_path), format="json")
+        
+        assert saved == {
+            "alice": str(tmp_path / "alice_report.json"),
+            "bob/smith": str(tmp_path / "bob_smith_report.json")
+        }
+        alice = json.loads(Path(saved["alice"]).read_text(encoding="utf-8"))
+        assert alice["overall_score"] == 82.5
+        assert alice["skill_scores"] == {"python": 9}
+    
+    def test_json_matches_save_json(self, report_generator, reports, tmp_path):
+        """Test that batch saving produces the same bytes as FileUtils.save_json."""
+        saved = report_generator.save_reports_batch(reports, str(tmp_path / "batch"))
+        
+        single = tmp_path / "single.json"
+        FileUtils(str(tmp_path)).save_json(reports["alice"], str(single))
+        
+        assert Path(saved["alice"]).read_bytes() == single.read_bytes()
+    
+    def test_markdown_reports_contain_summary(self, report_generator, reports, tmp_path):
+        """Test that the markdown format writes the summary report."""
+        saved = report_generator.save_reports_batch(reports, str(tmp_path), format="markdown")
+        
+        assert Path(saved["alice"]).read_text(encoding="utf-8") == "# Alice\nStrong candidate"
+        assert saved["bob/smith"].endswith("bob_smith_report.md")
+
+
+class TestGenerateBatchReports:
+    """Test cases for batched report generation."""
+    
+    def test_llm_failure_yields_error_per_candidate(self, monkeypatch):
+        """Test that a failing model load reports an error for every candidate."""
+        def failing_client(self):
+            raise RuntimeError("model load failed")
+        
+        monkeypatch.setattr(ReportGenerator, "llm_client", property(failing_client))
+        evaluations = [
+            {"candidate_name": "alice", "cv_analysis": {"overall_score": 80}, "interview_scores": {}},
+            {"candidate_name": "bob", "cv_analysis": {"overall_score": 60}, "interview_scores": {}}
+        ]
+        
+        reports = ReportGenerator().generate_batch_reports(evaluations)
+        
+        assert reports == {
+            "alice": {"error": "model load failed"},
+            "bob": {"error": "model load failed"}
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,184 @@
+"""
+Unit tests for utility modules.
+
+This module contains tests for the document parse cache, schema validation of
+JSON files, the semantic cache of CV analysis results and prompt memoization.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils import file_utils, prompt_templates
+from src.utils.file_utils import FileUtils
+from src.utils.prompt_templates import PromptTemplates
+from src.utils.semantic_cache import SemanticCache
+
+
+class TestParseCache:
+    """Test cases for the content-hash parse cache of documents."""
+    
+    @pytest.fixture
+    def utils(self, tmp_path, monkeypatch):
+        """Create a file utils instance whose Word parser counts its calls."""
+        utils = FileUtils(str(tmp_path))
+        utils.parsed = []
+        
+        def fake_extract(data):
+            utils.parsed.append(data)
+            return data.decode("utf-8")
+        
+        monkeypatch.setattr(utils, "_extract_word_text", fake_extract)
+        return utils
+    
+    def test_unchanged_document_is_parsed_once(self, utils, tmp_path):
+        """Test that re-reading identical bytes is served from the cache."""
+        path = tmp_path / "cv.docx"
+        path.write_bytes(b"Python developer")
+        
+        assert utils.read_file(str(path)) == "Python developer"
+        assert utils.read_file(str(path)) == "Python developer"
+        assert len(utils.parsed) == 1
+    
+    def test_changed_document_is_parsed_again(self, utils, tmp_path):
+        """Test that new bytes at the same path miss the cache."""
+        path = tmp_path / "cv.docx"
+        path.write_bytes(b"Python developer")
+        utils.read_file(str(path))
+        
+        path.write_bytes(b"Java developer")
+        
+        assert utils.read_file(str(path)) == "Java developer"
+        assert len(utils.parsed) == 2
+    
+    def test_parser_version_invalidates_entries(self, utils, tmp_path, monkeypatch):
+        """Test that bumping the parser version ignores older entries."""
+        path = tmp_path / "cv.docx"
+        path.write_bytes(b"Python developer")
+        utils.read_file(str(path))
+        
+        monkeypatch.setattr(file_utils, "_PARSER_VERSION", file_utils._PARSER_VERSION + 1)
+        utils.read_file(str(path))
+        
+        assert len(utils.parsed) == 2
+
+
+class TestLoadJsonSchema:
+    """Test cases for schema validation in load_json."""
+    
+    @pytest.fixture
+    def utils(self, tmp_path):
+        """Create a file utils instance in a temporary directory."""
+        return FileUtils(str(tmp_path))
+    
+    def test_valid_file_is_loaded(self, utils, tmp_path):
+        """Test that data matching the schema is returned unchanged."""
+        data = {"candidate_id": "c1", "responses": {"q1": "answer"}}
+        path = tmp_path / "responses.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        
+        assert utils.load_json(str(path), schema="candidate_responses") == data
+    
+    def test_invalid_file_returns_empty_dict(self, utils, tmp_path):
+        """Test that data violating the schema is rejected."""
+        pytest.importorskip("fastjsonschema")
+        path = tmp_path / "responses.json"
+        path.write_text(json.dumps({"candidate_id": "c1", "responses": {"q1": 3}}), encoding="utf-8")
+        
+        assert utils.load_json(str(path), schema="candidate_responses") == {}
+
+
+class TestSemanticCache:
+    """Test cases for the semantic cache of CV analysis results."""
+    
+    JOB = "Senior Python developer with Django experience"
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a semantic cache in a temporary directory."""
+        return SemanticCache(directory=str(tmp_path / "semantic"))
+    
+    @pytest.fixture
+    def embedding(self):
+        """Normalized CV embedding."""
+        vector = np.array([0.6, 0.8, 0.0], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+    
+    def test_same_job_description_hits(self, cache, embedding):
+        """Test that a similar CV against the same job description reuses the result."""
+        cache.add(self.JOB, embedding, {"python", "django"}, {"overall_score": 80})
+        
+        assert cache.lookup(self.JOB, embedding, {"python", "django"}) == {"overall_score": 80}
+    
+    def test_changed_job_description_misses(self, cache, embedding):
+        """Test that an analysis is never reused for a different job description."""
+        cache.add(self.JOB, embedding, {"python", "django"}, {"overall_score": 80})
+        
+        assert cache.lookup(self.JOB + " and Kubernetes", embedding, {"python", "django"}) is None
+    
+    def test_skill_guard_rejects_different_skills(self, cache, embedding):
+        """Test that a close embedding with a different skill set misses."""
+        cache.add(self.JOB, embedding, {"python", "django"}, {"overall_score": 80})
+        
+        assert cache.lookup(self.JOB, embedding, {"java", "spring"}) is None
+    
+    def test_results_are_copies(self, cache, embedding):
+        """Test that neither the stored nor the returned result aliases the cache."""
+        result = {"skills": ["python"]}
+        cache.add(self.JOB, embedding, {"python"}, result)
+        result["skills"].append("java")
+        
+        hit = cache.lookup(self.JOB, embedding, {"python"})
+        hit["skills"].append("go")
+        
+        assert cache.lookup(self.JOB, embedding, {"python"}) == {"skills": ["python"]}
+    
+    def test_entries_persist_across_instances(self, cache, embedding):
+        """Test that entries are reloaded from disk, including after a torn last line."""
+        cache.add(self.JOB, embedding, {"python"}, {"overall_score": 80})
+        with open(cache.entries_path, "a", encoding="utf-8") as file:
+            file.write('{"job": "torn')
+        
+        reloaded = SemanticCache(directory=str(cache.directory))
+        
+        assert reloaded.lookup(self.JOB, embedding, {"python"}) == {"overall_score": 80}
+        assert reloaded.entries_path.read_text(encoding="utf-8").endswith("\n")
+
+
+class TestPromptMemoization:
+    """Test cases for the digest-keyed prompt builder caches."""
+    
+    def test_same_inputs_reuse_the_prompt(self):
+        """Test that repeated inputs return the memoized prompt."""
+        first = PromptTemplates.cv_analysis_prompt("Python developer", "Backend role")
+        
+        assert PromptTemplates.cv_analysis_prompt("Python developer", "Backend role") is first
+        assert PromptTemplates.cv_analysis_prompt("Java developer", "Backend role") != first
+    
+    def test_criteria_are_keyed_per_item(self):
+        """Test that criteria lists joining to the same text get different prompts."""
+        split = PromptTemplates.interview_scoring_prompt("Q", "A", ["clarity", "depth"])
+        joined = PromptTemplates.interview_scoring_prompt("Q", "A", ["clarity\x1fdepth"])
+        
+        assert split != joined
+    
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that old prompts are evicted beyond the cache size."""
+        monkeypatch.setattr(prompt_templates, "_PROMPT_CACHE_SIZE", 2)
+        first = PromptTemplates.skill_extraction_prompt("cv 0")
+        for index in range(1, 4):
+            PromptTemplates.skill_extraction_prompt(f"cv {index}")
+        
+        again = PromptTemplates.skill_extraction_prompt("cv 0")
+        
+        assert again == first and again is not first
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
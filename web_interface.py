@@ -13,12 +13,14 @@ Usage:
 import streamlit as st
 import sys
 import os
+import asyncio
+import shutil
+import tempfile
 from pathlib import Path
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import hashlib
 from datetime import datetime
+from typing import Dict, List, NamedTuple
 
 # Add the project root to the Python path
 sys.path.append(str(Path(__file__).parent))
@@ -27,6 +29,7 @@ from src.evaluation.cv_analyzer import CVAnalyzer
 from src.evaluation.interview_scorer import InterviewScorer
 from src.evaluation.report_generator import ReportGenerator
 from src.utils.file_utils import FileUtils
+from src.utils.llm_cache import LLMCache
 
 
 def setup_page():
@@ -42,22 +45,117 @@ def setup_page():
     st.markdown("---")
 
 
+@st.cache_resource(show_spinner="Initializing CV Analyzer...")
+def get_cv_analyzer():
+    """Return the CV analyzer shared by all sessions of this server process."""
+    return CVAnalyzer()
+
+
+@st.cache_resource(show_spinner="Initializing Interview Scorer...")
+def get_interview_scorer():
+    """Return the interview scorer shared by all sessions of this server process."""
+    return InterviewScorer()
+
+
+@st.cache_resource(show_spinner="Initializing Report Generator...")
+def get_report_generator():
+    """Return the report generator shared by all sessions of this server process."""
+    return ReportGenerator()
+
+
+@st.cache_resource
+def get_file_utils():
+    """Return the file utilities shared by all sessions of this server process."""
+    return FileUtils()
+
+
+@st.cache_resource
+def get_llm_cache():
+    """Return the LLM result cache shared by all sessions of this server process."""
+    return LLMCache()
+
+
 def initialize_components():
-    """Initialize evaluation components."""
-    if 'cv_analyzer' not in st.session_state:
-        with st.spinner("Initializing CV Analyzer..."):
-            st.session_state.cv_analyzer = CVAnalyzer()
-    
-    if 'interview_scorer' not in st.session_state:
-        with st.spinner("Initializing Interview Scorer..."):
-            st.session_state.interview_scorer = InterviewScorer()
-    
-    if 'report_generator' not in st.session_state:
-        with st.spinner("Initializing Report Generator..."):
-            st.session_state.report_generator = ReportGenerator()
+    """Initialize evaluation components (loaded once per server process, not per session)."""
+    get_cv_analyzer()
+    get_interview_scorer()
+    get_report_generator()
+    get_file_utils()
+    get_llm_cache()
+    st.session_state.components_ready = True
+
+
+@st.cache_data
+def _read_file_cached(path, mtime):
+    """Read and parse a file once per (path, modification time) across reruns."""
+    return get_file_utils().read_file(path)
+
+
+def read_file(path):
+    """Read a file through the rerun-persistent cache."""
+    return _read_file_cached(path, os.path.getmtime(path))
+
+
+def _upload_id(uploaded_file):
+    """Identify an upload so that reruns do not save it again."""
+    return getattr(uploaded_file, "file_id", None) or (uploaded_file.name, uploaded_file.size)
+
+
+def _copy_upload(uploaded_file):
+    """
+    Stream an uploaded file into the temp directory and return the written path.
+    
+    The file is copied in 1 MiB chunks under a generated name (the client-supplied
+    name is only used for its stem and suffix).
+    """
+    os.makedirs("temp", exist_ok=True)
+    name = Path(uploaded_file.name)
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(dir="temp", prefix=f"{name.stem}_", suffix=name.suffix, delete=False) as f:
+        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+    return f.name
+
+
+async def _copy_uploads(uploaded_files):
+    """Copy several uploads concurrently in the default thread pool."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(None, _copy_upload, f) for f in uploaded_files))
+
+
+def save_uploads(uploads):
+    """
+    Save new uploads and store their paths in the session.
+    
+    The temp file of an upload that is replaced by a new one is deleted.
+    
+    Args:
+        uploads: Uploaded files keyed by the session key for their path; only files
+            not already saved by an earlier rerun are written, concurrently
+    """
+    pending = {
+        path_key: uploaded_file for path_key, uploaded_file in uploads.items()
+        if path_key not in st.session_state
+        or st.session_state.get(f"{path_key}_upload_id") != _upload_id(uploaded_file)
+    }
+    if not pending:
+        return
+    
+    if len(pending) == 1:
+        paths = [_copy_upload(uploaded_file) for uploaded_file in pending.values()]
+    else:
+        paths = asyncio.run(_copy_uploads(list(pending.values())))
     
-    if 'file_utils' not in st.session_state:
-        st.session_state.file_utils = FileUtils()
+    for (path_key, uploaded_file), path in zip(pending.items(), paths):
+        old_path = st.session_state.get(path_key)
+        st.session_state[path_key] = path
+        st.session_state[f"{path_key}_upload_id"] = _upload_id(uploaded_file)
+        
+        # Every upload gets a fresh temp file, so delete the one it replaces
+        if old_path and old_path != path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
 
 
 def upload_section():
@@ -65,6 +163,7 @@ def upload_section():
     st.header("📁 Upload Files")
     
     col1, col2 = st.columns(2)
+    uploads = {}
     
     with col1:
         st.subheader("CV Upload")
@@ -76,13 +175,7 @@ def upload_section():
         
         if uploaded_cv:
             st.success(f"✅ CV uploaded: {uploaded_cv.name}")
-            
-            # Save uploaded file
-            cv_path = f"temp/{uploaded_cv.name}"
-            os.makedirs("temp", exist_ok=True)
-            with open(cv_path, "wb") as f:
-                f.write(uploaded_cv.getbuffer())
-            st.session_state.cv_path = cv_path
+            uploads["cv_path"] = uploaded_cv
     
     with col2:
         st.subheader("Job Description Upload")
@@ -94,12 +187,10 @@ def upload_section():
         
         if uploaded_jd:
             st.success(f"✅ Job Description uploaded: {uploaded_jd.name}")
-            
-            # Save uploaded file
-            jd_path = f"temp/{uploaded_jd.name}"
-            with open(jd_path, "wb") as f:
-                f.write(uploaded_jd.getbuffer())
-            st.session_state.jd_path = jd_path
+            uploads["jd_path"] = uploaded_jd
+    
+    # Save uploaded files (both at once when CV and job description arrive together)
+    save_uploads(uploads)
 
 
 def cv_analysis_section():
@@ -108,9 +199,13 @@ def cv_analysis_section():
     
     if 'cv_path' in st.session_state and 'jd_path' in st.session_state:
         if st.button("🔍 Analyze CV", type="primary"):
+            # Interview results and the report belong to the previous analysis
+            for key in ("interview_questions", "interview_results", "comprehensive_report"):
+                st.session_state.pop(key, None)
+            
             with st.spinner("Analyzing CV..."):
                 try:
-                    analysis_result = st.session_state.cv_analyzer.analyze_cv_against_job(
+                    analysis_result = get_cv_analyzer().analyze_cv_against_job(
                         st.session_state.cv_path, st.session_state.jd_path
                     )
                     
@@ -127,9 +222,36 @@ def cv_analysis_section():
         st.info("📝 Please upload both CV and Job Description files to begin analysis.")
 
 
+class CVResultView(NamedTuple):
+    """Fields of a CV analysis result read by the display functions."""
+    
+    score: float
+    recommendation: str
+    risk: str
+    gap_score: float
+    missing_skills: List[str]
+    strengths: List[str]
+    weaknesses: List[str]
+    
+    @classmethod
+    def from_dict(cls, analysis_result: Dict) -> "CVResultView":
+        """Extract the displayed fields from an analysis result, with defaults."""
+        overall = analysis_result.get("overall_assessment", {})
+        skill_gaps = analysis_result.get("skill_gaps", {})
+        return cls(
+            score=overall.get('overall_score', 0),
+            recommendation=overall.get('hiring_recommendation', 'Unknown'),
+            risk=overall.get('risk_level', 'Unknown'),
+            gap_score=skill_gaps.get("gap_score", 0),
+            missing_skills=skill_gaps.get("missing_technical_skills", []),
+            strengths=overall.get("strengths", []),
+            weaknesses=overall.get("weaknesses", [])
+        )
+
+
 def display_cv_results(analysis_result):
     """Display CV analysis results."""
-    overall = analysis_result.get("overall_assessment", {})
+    view = CVResultView.from_dict(analysis_result)
     
     # Create metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -137,82 +259,146 @@ def display_cv_results(analysis_result):
     with col1:
         st.metric(
             "Overall Score",
-            f"{overall.get('overall_score', 0):.1f}/100",
+            f"{view.score:.1f}/100",
             delta=None
         )
     
     with col2:
-        recommendation = overall.get('hiring_recommendation', 'Unknown')
-        st.metric("Recommendation", recommendation.replace('_', ' ').title())
+        st.metric("Recommendation", view.recommendation.replace('_', ' ').title())
     
     with col3:
-        risk_level = overall.get('risk_level', 'Unknown')
-        st.metric("Risk Level", risk_level.title())
+        st.metric("Risk Level", view.risk.title())
     
     with col4:
-        skill_gaps = analysis_result.get("skill_gaps", {})
-        gap_score = skill_gaps.get("gap_score", 0)
-        st.metric("Skill Gap", f"{gap_score:.1f}%")
+        st.metric("Skill Gap", f"{view.gap_score:.1f}%")
     
+    # Detailed results
+    _cv_result_tabs(view)
+
+
+@st.cache_data(show_spinner=False)
+def _score_gauge(score):
+    """Build the overall score gauge once per score value."""
+    # plotly is imported on first use to keep cold start fast
+    import plotly.graph_objects as go
+    
+    return go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Overall Score"},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 70], 'color': "yellow"},
+                {'range': [70, 85], 'color': "orange"},
+                {'range': [85, 100], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+
+
+def _cv_result_tabs(view):
+    """Display the detailed CV analysis tabs."""
     # Create tabs for detailed results
     tab1, tab2, tab3, tab4 = st.tabs(["📈 Overview", "🔍 Skill Gaps", "✅ Strengths", "⚠️ Areas of Concern"])
     
     with tab1:
         # Overall score chart
-        score = overall.get('overall_score', 0)
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Overall Score"},
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 70], 'color': "yellow"},
-                    {'range': [70, 85], 'color': "orange"},
-                    {'range': [85, 100], 'color': "green"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 70
-                }
-            }
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_score_gauge(view.score), use_container_width=True)
     
     with tab2:
-        skill_gaps = analysis_result.get("skill_gaps", {})
-        missing_skills = skill_gaps.get("missing_technical_skills", [])
-        
-        if missing_skills:
+        if view.missing_skills:
             st.subheader("Missing Technical Skills")
-            for skill in missing_skills:
+            for skill in view.missing_skills:
                 st.write(f"• {skill}")
         else:
             st.success("✅ No missing technical skills identified!")
     
     with tab3:
-        strengths = overall.get("strengths", [])
-        if strengths:
+        if view.strengths:
             st.subheader("Key Strengths")
-            for strength in strengths:
+            for strength in view.strengths:
                 st.write(f"✅ {strength}")
         else:
             st.info("No specific strengths identified.")
     
     with tab4:
-        weaknesses = overall.get("weaknesses", [])
-        if weaknesses:
+        if view.weaknesses:
             st.subheader("Areas for Improvement")
-            for weakness in weaknesses:
+            for weakness in view.weaknesses:
                 st.write(f"⚠️ {weakness}")
         else:
             st.success("✅ No major areas of concern identified!")
 
 
+class _UncachedResult(Exception):
+    """Carries an error result out of a cached function so that it is not memoized."""
+    
+    def __init__(self, result):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
+def _content_hash(text):
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Leading-underscore arguments are skipped by Streamlit's hasher; the hashes key the cache
+@st.cache_data(show_spinner=False)
+def _generate_questions_cached(jd_hash, cv_hash, _jd_content, _cv_analysis):
+    """Generate interview questions once per (job description, CV analysis) content."""
+    questions = get_interview_scorer().generate_interview_questions(_jd_content, _cv_analysis)
+    if "error" in questions:
+        raise _UncachedResult(questions)
+    return questions
+
+
+@st.cache_data(show_spinner=False)
+def _score_response_cached(question_hash, response_hash, _question, _response):
+    """Score an interview response once per (question, response) content."""
+    score_result = get_interview_scorer().score_interview_response(_question, _response)
+    if "error" in score_result:
+        raise _UncachedResult(score_result)
+    return score_result
+
+
+def _memoize_llm_calls():
+    """Check whether LLM results are reproducible enough to be reused across clicks."""
+    return LLMCache.is_cacheable(get_interview_scorer().llm_client.config['model'])
+
+
+def generate_questions(jd_content, cv_analysis):
+    """Generate interview questions, reusing results for identical inputs."""
+    if not _memoize_llm_calls():
+        return get_interview_scorer().generate_interview_questions(jd_content, cv_analysis)
+    
+    cv_hash = _content_hash(json.dumps(cv_analysis, sort_keys=True, default=str))
+    try:
+        return _generate_questions_cached(_content_hash(jd_content), cv_hash, jd_content, cv_analysis)
+    except _UncachedResult as e:
+        return e.result
+
+
+def score_response(question, response):
+    """Score an interview response, reusing results for identical inputs."""
+    if not _memoize_llm_calls():
+        return get_interview_scorer().score_interview_response(question, response)
+    
+    try:
+        return _score_response_cached(_content_hash(question), _content_hash(response), question, response)
+    except _UncachedResult as e:
+        return e.result
+
+
 def interview_section():
     """Interview scoring section."""
     st.header("🎤 Interview Scoring")
@@ -223,10 +409,8 @@ def interview_section():
         if st.button("❓ Generate Questions", type="secondary"):
             with st.spinner("Generating personalized interview questions..."):
                 try:
-                    jd_content = st.session_state.file_utils.read_file(st.session_state.jd_path)
-                    questions = st.session_state.interview_scorer.generate_interview_questions(
-                        jd_content, st.session_state.cv_analysis
-                    )
+                    jd_content = read_file(st.session_state.jd_path)
+                    questions = generate_questions(jd_content, st.session_state.cv_analysis)
                     
                     if "error" not in questions:
                         st.session_state.interview_questions = questions
@@ -253,11 +437,11 @@ def interview_section():
         if st.button("📊 Score Response", type="secondary"):
             with st.spinner("Scoring response..."):
                 try:
-                    score_result = st.session_state.interview_scorer.score_interview_response(
-                        question, response
-                    )
+                    score_result = score_response(question, response)
                     
                     if "error" not in score_result:
+                        # Keep the latest score per question for the comprehensive report
+                        st.session_state.setdefault("interview_results", {})[question] = score_result
                         display_interview_score(score_result)
                     else:
                         st.error(f"❌ Scoring failed: {score_result['error']}")
@@ -286,38 +470,61 @@ def display_interview_questions(questions):
                 st.write(f"**Purpose:** {q.get('purpose', 'N/A')}")
 
 
+class InterviewScoreView(NamedTuple):
+    """Fields of an interview score result read by the display functions."""
+    
+    score: float
+    recommendation: str
+    confidence: float
+    criteria_scores: Dict[str, float]
+    strengths: List[str]
+    weaknesses: List[str]
+    
+    @classmethod
+    def from_dict(cls, score_result: Dict) -> "InterviewScoreView":
+        """Extract the displayed fields from a score result, with defaults."""
+        return cls(
+            score=score_result.get("overall_score", 0),
+            recommendation=score_result.get("recommendation", "Unknown"),
+            confidence=score_result.get("confidence", 0),
+            criteria_scores=score_result.get("criteria_scores", {}),
+            strengths=score_result.get("strengths", []),
+            weaknesses=score_result.get("weaknesses", [])
+        )
+
+
 def display_interview_score(score_result):
     """Display interview scoring results."""
     st.subheader("Interview Score Results")
     
-    overall_score = score_result.get("overall_score", 0)
+    view = InterviewScoreView.from_dict(score_result)
     
     # Create metrics
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Overall Score", f"{overall_score}/10")
+        st.metric("Overall Score", f"{view.score}/10")
     
     with col2:
-        recommendation = score_result.get("recommendation", "Unknown")
-        st.metric("Recommendation", recommendation.replace('_', ' ').title())
+        st.metric("Recommendation", view.recommendation.replace('_', ' ').title())
     
     with col3:
-        confidence = score_result.get("confidence", 0)
-        st.metric("Confidence", f"{confidence}%")
+        st.metric("Confidence", f"{view.confidence}%")
     
     # Criteria breakdown
-    criteria_scores = score_result.get("criteria_scores", {})
-    if criteria_scores:
+    if view.criteria_scores:
         st.subheader("Criteria Breakdown")
         
         criteria_data = []
-        for criteria, score in criteria_scores.items():
+        for criteria, score in view.criteria_scores.items():
             criteria_data.append({
                 "Criteria": criteria.replace('_', ' ').title(),
                 "Score": score
             })
         
+        import pandas as pd
+        import plotly.express as px
+        
         df = pd.DataFrame(criteria_data)
         fig = px.bar(df, x="Criteria", y="Score", title="Interview Criteria Scores")
         st.plotly_chart(fig, use_container_width=True)
@@ -326,20 +533,44 @@ def display_interview_score(score_result):
     col1, col2 = st.columns(2)
     
     with col1:
-        strengths = score_result.get("strengths", [])
-        if strengths:
+        if view.strengths:
             st.subheader("Strengths")
-            for strength in strengths:
+            for strength in view.strengths:
                 st.write(f"✅ {strength}")
     
     with col2:
-        weaknesses = score_result.get("weaknesses", [])
-        if weaknesses:
+        if view.weaknesses:
             st.subheader("Areas for Improvement")
-            for weakness in weaknesses:
+            for weakness in view.weaknesses:
                 st.write(f"⚠️ {weakness}")
 
 
+def generate_report_cached(cv_analysis, interview_scores, candidate_info):
+    """Generate a comprehensive report, reusing the cached copy for identical inputs."""
+    report_generator = get_report_generator()
+    model_config = report_generator.config['model']
+    
+    # Sampled generations are not reproducible, so only greedy results are cached
+    if not LLMCache.is_cacheable(model_config):
+        return report_generator.generate_comprehensive_report(cv_analysis, interview_scores, candidate_info)
+    
+    cache = get_llm_cache()
+    key = LLMCache.cache_key(
+        model_config['name'], cv_analysis=cv_analysis,
+        interview_scores=interview_scores, candidate_info=candidate_info
+    )
+    report = cache.get(key)
+    if report is not None:
+        # The content is reused, but the report is issued now
+        report.setdefault("metadata", {})["generation_timestamp"] = datetime.now().isoformat()
+        return report
+    
+    report = report_generator.generate_comprehensive_report(cv_analysis, interview_scores, candidate_info)
+    if "error" not in report:
+        cache.set(key, report)
+    return report
+
+
 def report_section():
     """Report generation section."""
     st.header("📋 Generate Report")
@@ -348,14 +579,19 @@ def report_section():
         if st.button("📄 Generate Comprehensive Report", type="primary"):
             with st.spinner("Generating comprehensive report..."):
                 try:
-                    # Create mock interview scores for demonstration
-                    mock_interview_scores = {
-                        "overall_assessment": {
-                            "overall_score": 7.5,
-                            "performance_level": "good",
-                            "recommendation": "hire"
+                    interview_results = st.session_state.get("interview_results", {})
+                    if interview_results:
+                        interview_scores = get_interview_scorer().summarize_scores(list(interview_results.values()))
+                    else:
+                        # Create mock interview scores for demonstration
+                        st.info("ℹ️ No interview responses scored yet; using demonstration interview scores.")
+                        interview_scores = {
+                            "overall_assessment": {
+                                "overall_score": 7.5,
+                                "performance_level": "good",
+                                "recommendation": "hire"
+                            }
                         }
-                    }
                     
                     candidate_info = {
                         "name": "Uploaded Candidate",
@@ -363,8 +599,8 @@ def report_section():
                         "job_description": "uploaded_jd"
                     }
                     
-                    report = st.session_state.report_generator.generate_comprehensive_report(
-                        st.session_state.cv_analysis, mock_interview_scores, candidate_info
+                    report = generate_report_cached(
+                        st.session_state.cv_analysis, interview_scores, candidate_info
                     )
                     
                     if "error" not in report:
@@ -440,17 +676,17 @@ def sidebar():
     st.sidebar.markdown("---")
     
     st.sidebar.subheader("📊 System Status")
-    if 'cv_analyzer' in st.session_state:
+    if st.session_state.get('components_ready', False):
         st.sidebar.success("✅ CV Analyzer Ready")
     else:
         st.sidebar.error("❌ CV Analyzer Not Ready")
     
-    if 'interview_scorer' in st.session_state:
+    if st.session_state.get('components_ready', False):
         st.sidebar.success("✅ Interview Scorer Ready")
     else:
         st.sidebar.error("❌ Interview Scorer Not Ready")
     
-    if 'report_generator' in st.session_state:
+    if st.session_state.get('components_ready', False):
         st.sidebar.success("✅ Report Generator Ready")
     else:
         st.sidebar.error("❌ Report Generator Not Ready")